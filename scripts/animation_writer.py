@@ -0,0 +1,316 @@
+import io
+import itertools
+import multiprocessing
+import os
+import queue
+import struct
+import sys
+import time
+import traceback
+import zlib
+from PIL import ImageChops
+from gif_writer import GifWriter
+
+
+class ApngWriter:
+    """
+    Incremental animated PNG writer with the same interface as GifWriter.
+
+    Frames after the first are cropped to the bounding box of what changed
+    and drawn over the previous frame (dispose none, blend source); identical
+    frames only extend the previous frame's duration. Nothing is quantized:
+    "P" frames are stored against the first frame's palette and everything
+    else as 8-bit RGB. The frame count in the header is filled in by close().
+    """
+
+    def __init__(self, path, loop=0):
+        self.path = path
+        self.loop = loop
+        self.frame_count = 0
+        self._fp = None
+        self._mode = None
+        self._palette = None
+        self._previous = None
+        self._actl_offset = None
+        self._sequence = 0
+        self._written = 0
+        # [bbox, region, duration]
+        self._pending = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._fp is not None:
+            self._fp.close()
+
+    def add(self, frame, duration):
+        if self._previous is None:
+            self._start(frame)
+        self.frame_count += 1
+
+        if self._mode == "P":
+            if frame.mode != "P" or frame.getpalette() != self._palette:
+                raise ValueError("APNG frames must share the first frame's palette")
+            current = frame
+        else:
+            current = frame.convert("RGB")
+
+        if self._previous is None:
+            bbox = (0, 0) + current.size
+        else:
+            bbox = ImageChops.difference(current, self._previous).getbbox()
+            if bbox is None:
+                self._pending[2] += duration
+                return
+        self._previous = current
+
+        self._flush()
+        self._pending = [bbox, current.crop(bbox), duration]
+
+    def close(self):
+        if self._fp is None:
+            raise ValueError("No frames to write")
+        if self._fp.closed:
+            return
+        self._flush()
+        self._chunk(b"IEND", b"")
+        # Now that the number of frames is known, patch it into acTL
+        self._fp.seek(self._actl_offset)
+        self._chunk(b"acTL", struct.pack(">II", self._written, self.loop))
+        self._fp.close()
+
+    def _start(self, frame):
+        self._mode = "P" if frame.mode == "P" else "RGB"
+        output_dir = os.path.dirname(self.path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self._fp = open(self.path, "wb")
+
+        width, height = frame.size
+        self._fp.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3 if self._mode == "P" else 2, 0, 0, 0))
+        if self._mode == "P":
+            self._palette = frame.getpalette()
+            self._chunk(b"PLTE", bytes(self._palette))
+        self._actl_offset = self._fp.tell()
+        self._chunk(b"acTL", struct.pack(">II", 0, self.loop))
+
+    def _chunk(self, kind, data):
+        self._fp.write(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data)))
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        bbox, region, duration = self._pending
+        self._pending = None
+
+        # Delays are 16-bit fractions of a second
+        delay, denominator = (duration, 1000) if duration < 0x10000 else (min(duration // 10, 0xFFFF), 100)
+        self._chunk(b"fcTL", struct.pack(">IIIIIHHBB", self._sequence, region.width, region.height, bbox[0], bbox[1], delay, denominator, 0, 0))
+        self._sequence += 1
+
+        buf = io.BytesIO()
+        # Keep 8-bit indices even when the palette would fit in fewer bits
+        options = {"bits": 8} if self._mode == "P" else {}
+        region.save(buf, format="PNG", **options)
+        data = buf.getvalue()
+        pos = 8
+        while pos < len(data):
+            length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+            if kind == b"IDAT":
+                payload = data[pos + 8:pos + 8 + length]
+                if self._written == 0:
+                    # The first frame doubles as the default image
+                    self._chunk(b"IDAT", payload)
+                else:
+                    self._chunk(b"fdAT", struct.pack(">I", self._sequence) + payload)
+                    self._sequence += 1
+            pos += length + 12
+        self._written += 1
+
+
+class WebPWriter:
+    """
+    Animated WebP through Pillow. Same interface as GifWriter, but Pillow's
+    encoder takes every frame at once, so frames are kept until close()
+    rather than streamed. Lossless by default; lossy uses `quality`.
+    """
+
+    def __init__(self, path, loop=0, lossless=True, quality=80, method=4):
+        self.path = path
+        self.loop = loop
+        self.options = dict(lossless=lossless, quality=quality, method=method)
+        self.frame_count = 0
+        self._frames = []
+        self._durations = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def add(self, frame, duration):
+        self.frame_count += 1
+        if self._frames and not ImageChops.difference(frame, self._frames[-1]).getbbox():
+            self._durations[-1] += duration
+            return
+        self._frames.append(frame)
+        self._durations.append(duration)
+
+    def close(self):
+        if not self._frames:
+            raise ValueError("No frames to write")
+        output_dir = os.path.dirname(self.path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self._frames[0].save(self.path, format="WEBP", save_all=True, append_images=self._frames[1:],
+                             duration=self._durations, loop=self.loop, **self.options)
+        self._frames = []
+
+
+# Backend name -> (writer class, extra options)
+BACKENDS = {
+    "gif": (GifWriter, {}),
+    "apng": (ApngWriter, {}),
+    "webp": (WebPWriter, {"lossless": True}),
+    "webp-lossy": (WebPWriter, {"lossless": False, "quality": 80}),
+}
+
+EXTENSIONS = {".gif": "gif", ".png": "apng", ".apng": "apng", ".webp": "webp"}
+
+
+def backend_for(path, backend=None):
+    """The backend named by `backend`, or else the one matching the path's extension."""
+    if backend is None:
+        backend = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if backend is None:
+            raise ValueError(f"Can't tell the animation format of {path}; use one of {', '.join(EXTENSIONS)}")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown animation backend {backend!r}; choose from {', '.join(BACKENDS)}")
+    return backend
+
+
+def _encode_worker(backend, path, loop, frames, errors):
+    try:
+        writer_class, options = BACKENDS[backend]
+        with writer_class(path, loop, **options) as writer:
+            for frame, duration in iter(frames.get, None):
+                writer.add(frame, duration)
+    except BaseException:
+        errors.put(traceback.format_exc())
+        sys.exit(1)
+
+
+class PipelinedWriter:
+    """
+    Any backend running in its own process. add() hands frames over through
+    a bounded queue and returns as soon as there is room, so the caller
+    renders the next frame while earlier ones are diffed, quantized and
+    compressed. When the encoder falls behind, add() blocks until it catches
+    up.
+
+    Frames must not be modified after they have been added.
+    """
+
+    def __init__(self, path, loop=0, backend="gif", queue_size=8):
+        self.frame_count = 0
+        context = multiprocessing.get_context()
+        self._frames = context.Queue(maxsize=queue_size)
+        self._errors = context.Queue()
+        self._process = context.Process(target=_encode_worker, args=(backend, path, loop, self._frames, self._errors))
+        self._process.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._process.terminate()
+            self._process.join()
+            self._frames.cancel_join_thread()
+
+    def add(self, frame, duration):
+        self._put((frame, duration))
+        self.frame_count += 1
+
+    def close(self):
+        self._put(None)
+        self._process.join()
+        if not self.frame_count:
+            raise ValueError("No frames to write")
+        self._raise_if_failed()
+
+    def _put(self, item):
+        while True:
+            try:
+                self._frames.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                if not self._process.is_alive():
+                    self._process.join()
+                    self._raise_if_failed()
+                    raise RuntimeError("Animation encoder exited unexpectedly")
+
+    def _raise_if_failed(self):
+        if not self._process.exitcode:
+            return
+        # Frames still queued for the dead encoder must not block interpreter exit
+        self._frames.cancel_join_thread()
+        try:
+            error = self._errors.get(timeout=1)
+        except queue.Empty:
+            error = f"exit code {self._process.exitcode}"
+        raise RuntimeError(f"Animation encoder failed:\n{error}")
+
+
+def open_writer(path, loop=0, backend=None, pipeline=False):
+    """
+    Writer for `path`, picked by `backend` or the file extension (.gif,
+    .png/.apng, .webp). With `pipeline` it runs in its own process.
+    """
+    backend = backend_for(path, backend)
+    if pipeline:
+        return PipelinedWriter(path, loop, backend)
+    writer_class, options = BACKENDS[backend]
+    return writer_class(path, loop, **options)
+
+
+def write_animation(path, frames, durations, loop=0, backend=None, pipeline=False):
+    """
+    Writes every frame from the iterable `frames` with open_writer().
+    `durations` is one value per frame or a single int for all of them.
+    """
+    if isinstance(durations, int):
+        durations = itertools.repeat(durations)
+    with open_writer(path, loop, backend, pipeline) as writer:
+        for frame, duration in zip(frames, durations):
+            writer.add(frame, duration)
+
+
+def compare_backends(frames, durations, stem, loop=0, backends=None):
+    """
+    Encodes the same frames with each backend (to `stem` plus the backend's
+    extension) and returns [(backend, path, seconds, bytes)].
+    """
+    frames = list(frames)
+    rows = []
+    for backend in backends or BACKENDS:
+        extension = {"gif": ".gif", "apng": ".png"}.get(backend, ".webp")
+        path = f"{stem}-{backend}{extension}" if backend == "webp-lossy" else f"{stem}{extension}"
+        started = time.perf_counter()
+        write_animation(path, frames, durations, loop, backend)
+        rows.append((backend, path, time.perf_counter() - started, os.path.getsize(path)))
+    return rows
+
+
+def print_report(rows):
+    print(f"{'backend':<12}{'encode':>10}{'size':>14}  file")
+    for backend, path, seconds, size in rows:
+        print(f"{backend:<12}{seconds:>9.2f}s{size / 1024:>11.1f} KB  {path}")
@@ -1,35 +1,33 @@
 import os
 from PIL import Image
+from animation_writer import open_writer
 
 def create_seasons_gif(frame_paths, output_path, duration=500):
     """
     Creates an animated GIF from a list of image paths.
+
+    Frames are read and encoded one at a time, so only the frame being
+    written (and the one before it) is held in memory. The output format
+    follows the extension of output_path (.gif, .png/.apng, .webp).
     """
-    frames = []
+    existing = []
     for path in frame_paths:
         if os.path.exists(path):
-            img = Image.open(path)
-            # Ensure all images are the same size and converted to RGBA
-            img = img.convert("RGBA")
-            frames.append(img)
+            existing.append(path)
         else:
             print(f"Warning: Frame not found at {path}")
 
-    if not frames:
+    if not existing:
         print("Error: No frames found to create GIF.")
         return
 
-    # Save as GIF
     # duration is in milliseconds between frames
-    frames[0].save(
-        output_path,
-        save_all=True,
-        append_images=frames[1:],
-        optimize=False,
-        duration=duration,
-        loop=0
-    )
-    print(f"Successfully created GIF at {output_path}")
+    with open_writer(output_path, loop=0) as writer:
+        for path in existing:
+            with Image.open(path) as img:
+                # Ensure all images are converted to RGBA
+                writer.add(img.convert("RGBA"), duration)
+    print(f"Successfully created animation at {output_path}")
 
 if __name__ == "__main__":
     # Define asset paths
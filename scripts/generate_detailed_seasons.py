@@ -1,9 +1,13 @@
-from PIL import Image, ImageDraw
+from PIL import Image, ImageChops, ImageDraw
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import random
 import os
 import math
+import zlib
 from datetime import datetime, timedelta, timezone
+from animation_writer import BACKENDS, compare_backends, open_writer, print_report
 
 def hex_to_rgb(h):
     h = h.lstrip('#')
@@ -22,11 +26,74 @@ def get_current_hour():
             pass
     return datetime.now().hour
 
-# ─── BANNER: 1200 × 256 ───────────────────────────────────────────────────────
-def draw_scene(season, frame, W=1200, H=320):
-    img = Image.new("RGBA", (W, H))
-    d = ImageDraw.Draw(img)
 
+# ─── RANDOM STREAMS ──────────────────────────────────────────────────────────
+def _seed(*key):
+    # Seed for the random stream named by key, e.g. ("winter", "snow", frame).
+    # Every layer draws from its own stream, so its output depends only on its
+    # key and never on what was drawn before it or in another thread/process.
+    # Scenery that several seasons share leaves the season out of its key so
+    # it stays in place when the season changes.
+    return zlib.crc32(repr(key).encode())
+
+
+# ─── BAKED LAYERS ────────────────────────────────────────────────────────────
+# (season, hour, W, H) -> {layer name: layer}, filled in by draw_scene
+_LAYER_CACHE = {}
+
+def _bake(draw, width, height, x=0, y=0):
+    # Runs draw(ImageDraw) on an empty RGBA canvas whose top-left corner sits
+    # at frame (x, y), and returns (image, mask, x, y): what was drawn, cropped
+    # to its bounding box, a mask of every pixel that was drawn and where the
+    # crop goes in the frame. A pixel counts as drawn when any band is set, so
+    # fully transparent colors are kept too; only (0, 0, 0, 0) would be missed.
+    canvas = Image.new("RGBA", (width, height))
+    draw(ImageDraw.Draw(canvas))
+    bands = canvas.split()
+    mask = bands[0]
+    for band in bands[1:]:
+        mask = ImageChops.lighter(mask, band)
+    mask = mask.point(lambda v: 255 if v else 0)
+    bbox = mask.getbbox()
+    if bbox is None:
+        return None
+    return canvas.crop(bbox), mask.crop(bbox), x + bbox[0], y + bbox[1]
+
+def _paste_layer(img, layer, offset=0):
+    # Pastes a baked layer scrolled `offset` pixels to the left. Going through
+    # the mask replaces the drawn pixels, alpha included, exactly as drawing
+    # them straight onto img would; pasting with the layer's own alpha would
+    # blend instead.
+    if layer is None:
+        return
+    image, mask, x, y = layer
+    img.paste(image, (x - offset, y), mask)
+
+
+# ─── SPRITES ─────────────────────────────────────────────────────────────────
+# key -> sprite: a baked layer whose x, y are relative to the sprite's anchor
+_SPRITES = {}
+
+def _sprite(key, draw, box):
+    # Characters and props that look the same wherever they are drawn are
+    # rendered once per key: draw(d, x, y) draws the sprite with its anchor at
+    # (x, y), and box = (left, top, right, bottom) bounds it around the anchor.
+    # The key must cover everything besides the position that changes the
+    # drawing.
+    if key not in _SPRITES:
+        left, top, right, bottom = box
+        _SPRITES[key] = _bake(lambda d: draw(d, -left, -top), right - left, bottom - top, left, top)
+    return _SPRITES[key]
+
+def _paste_sprite(img, sprite, x, y):
+    # Pastes a sprite with its anchor at (x, y), replacing pixels like _paste_layer
+    if sprite is not None:
+        image, mask, dx, dy = sprite
+        img.paste(image, (x + dx, y + dy), mask)
+
+
+# ─── BANNER: 1200 × 256 ───────────────────────────────────────────────────────
+def draw_scene(season, frame, W=1200, H=320, hour=None):
     # ── Palettes ──────────────────────────────────────────────────────────────
     P = {
         "spring":  dict(sky="#87CEFA", mtn="#7B68EE", road="#8B4513",
@@ -58,7 +125,8 @@ def draw_scene(season, frame, W=1200, H=320):
         spd = 3  # Serene pace for sakura
     shift = frame * spd
 
-    hour = get_current_hour()
+    if hour is None:
+        hour = get_current_hour()
     
     # --- Time-based Atmosphere Adjustments ---
     # Dawn: 5-7, Day: 8-16, Sunset: 17-19, Night: 20-4
@@ -79,185 +147,211 @@ def draw_scene(season, frame, W=1200, H=320):
         atmosphere_tint = (0, 0, 80, 100)
         sky_base = hex_to_rgb("#000033") # Midnight Blue
 
+    # Layers that don't change from frame to frame are drawn once per season
+    # and hour, then pasted into every frame (see _bake)
+    layers = _LAYER_CACHE.setdefault((season, hour, W, H), {})
+
+    def baked(name, draw, width=W, x=0):
+        if name not in layers:
+            layers[name] = _bake(draw, width, H, x)
+        return layers[name]
+
     # ── 1. Sky ────────────────────────────────────────────────────────────────
     # Blend season sky with time-based sky (50/50 blend)
     s_sky = hex_to_rgb(P[season]["sky"])
     final_sky = tuple(int((s_sky[i] + sky_base[i]) / 2) for i in range(3))
-    
-    d.rectangle([0, 0, W, SKY_H], fill=final_sky + (255,))
 
-    if season == "wasteland":
-        # Arid haze
-        for y in range(0, SKY_H, 4):
-            alpha = int(100 * (1 - y/SKY_H))
-            if 17 <= hour < 20: # Golden hour haze
-                d.rectangle([0, y, W, y+4], fill=(255, 200, 0, alpha))
-            elif hour >= 20 or hour < 5: # Night haze
-                d.rectangle([0, y, W, y+4], fill=(0, 0, 100, alpha))
-            else:
-                d.rectangle([0, y, W, y+4], fill=(255, 100, 0, alpha))
-    
-
-    # Sun / Moon
-    if hour >= 20 or hour < 6:
-        # Moon
-        d.ellipse([W-55, 10, W-15, 50], fill=(220, 230, 255, 200))
-        # Moon craters
-        rng_state = random.getstate()
-        random.seed(hour + 42)
-        for _ in range(5):
-            cx_offset = random.randint(10, 30)
-            cy_offset = random.randint(10, 30)
-            cr_size = random.randint(2, 5)
-            d.ellipse([W-55+cx_offset-cr_size, 10+cy_offset-cr_size, W-55+cx_offset+cr_size, 10+cy_offset+cr_size], fill=(180, 190, 220, 150))
-        random.setstate(rng_state)
-    elif 6 <= hour < 8 or 17 <= hour < 20:
-        # Low Sun (Orange/Red)
-        sun_y = 10 if hour < 8 else 30
-        d.ellipse([W-55, sun_y, W-15, sun_y + 40], fill=(255, 100, 0, 220))
-    else:
-        # High Sun
-        d.ellipse([W-55, 4, W-15, 44], fill=(255, 255, 200, 200))
+    def draw_sky(d):
+        d.rectangle([0, 0, W, SKY_H], fill=final_sky + (255,))
 
-    # ── 2. Mountains ──────────────────────────────────────────────────────────
-    # Mount Fuji (Spring only)
-    if season == "spring":
-        fuji_w = 400
-        fuji_h = 70
-        fuji_x = W // 2 - fuji_w // 2
-        fuji_y = SKY_H
-        # Main mountain body
-        d.polygon([
-            (fuji_x, fuji_y), 
-            (fuji_x + fuji_w // 2, fuji_y - fuji_h), 
-            (fuji_x + fuji_w, fuji_y)
-        ], fill=(123, 104, 238, 255)) # Medium slate blue
-        # Snow cap
-        cap_h = fuji_h // 3
-        d.polygon([
-            (fuji_x + fuji_w // 2 - fuji_w // 6, fuji_y - fuji_h + cap_h),
-            (fuji_x + fuji_w // 2, fuji_y - fuji_h),
-            (fuji_x + fuji_w // 2 + fuji_w // 6, fuji_y - fuji_h + cap_h),
-            (fuji_x + fuji_w // 2, fuji_y - fuji_h + cap_h + 5)
-        ], fill=(255, 255, 255, 255))
-
-    random.seed(11)
-    mx = -60
-    while mx < W + 60:
         if season == "wasteland":
-            # Rock Pillars and Plateaus
-            random.seed(mx + 500)
-            if random.random() > 0.6: # Plateau
-                pw = random.randint(150, 300)
-                ph = random.randint(40, 70)
-                d.rectangle([mx, SKY_H - ph, mx + pw, SKY_H], fill=c["mtn"] + (255,))
-                # Jagged top
-                for j in range(mx, mx + pw, 10):
-                    jy = SKY_H - ph - random.randint(0, 5)
-                    d.rectangle([j, jy, j+10, SKY_H - ph], fill=c["mtn"] + (255,))
-                mx += pw
-            else: # Pillar
-                pw = random.randint(30, 60)
-                ph = random.randint(80, 150)
-                d.rectangle([mx, SKY_H - ph, mx + pw, SKY_H], fill=c["mtn"] + (255,))
-                mx += pw + random.randint(50, 100)
+            # Arid haze
+            for y in range(0, SKY_H, 4):
+                alpha = int(100 * (1 - y/SKY_H))
+                if 17 <= hour < 20: # Golden hour haze
+                    d.rectangle([0, y, W, y+4], fill=(255, 200, 0, alpha))
+                elif hour >= 20 or hour < 5: # Night haze
+                    d.rectangle([0, y, W, y+4], fill=(0, 0, 100, alpha))
+                else:
+                    d.rectangle([0, y, W, y+4], fill=(255, 100, 0, alpha))
+
+
+        # Sun / Moon
+        if hour >= 20 or hour < 6:
+            # Moon
+            d.ellipse([W-55, 10, W-15, 50], fill=(220, 230, 255, 200))
+            # Moon craters
+            rng = random.Random(_seed("moon", hour))
+            for _ in range(5):
+                cx_offset = rng.randint(10, 30)
+                cy_offset = rng.randint(10, 30)
+                cr_size = rng.randint(2, 5)
+                d.ellipse([W-55+cx_offset-cr_size, 10+cy_offset-cr_size, W-55+cx_offset+cr_size, 10+cy_offset+cr_size], fill=(180, 190, 220, 150))
+        elif 6 <= hour < 8 or 17 <= hour < 20:
+            # Low Sun (Orange/Red)
+            sun_y = 10 if hour < 8 else 30
+            d.ellipse([W-55, sun_y, W-15, sun_y + 40], fill=(255, 100, 0, 220))
         else:
-            ph = 28 + random.randint(-6, 6)
-            bw = 65 + random.randint(0, 25)
-            d.polygon([(mx, SKY_H), (mx + bw//2, SKY_H - ph), (mx + bw, SKY_H)],
-                      fill=c["mtn"] + (255,))
-            mx += int(bw * 0.65)
+            # High Sun
+            d.ellipse([W-55, 4, W-15, 44], fill=(255, 255, 200, 200))
+
+        # ── 2. Mountains ──────────────────────────────────────────────────────
+        # Mount Fuji (Spring only)
+        if season == "spring":
+            fuji_w = 400
+            fuji_h = 70
+            fuji_x = W // 2 - fuji_w // 2
+            fuji_y = SKY_H
+            # Main mountain body
+            d.polygon([
+                (fuji_x, fuji_y),
+                (fuji_x + fuji_w // 2, fuji_y - fuji_h),
+                (fuji_x + fuji_w, fuji_y)
+            ], fill=(123, 104, 238, 255)) # Medium slate blue
+            # Snow cap
+            cap_h = fuji_h // 3
+            d.polygon([
+                (fuji_x + fuji_w // 2 - fuji_w // 6, fuji_y - fuji_h + cap_h),
+                (fuji_x + fuji_w // 2, fuji_y - fuji_h),
+                (fuji_x + fuji_w // 2 + fuji_w // 6, fuji_y - fuji_h + cap_h),
+                (fuji_x + fuji_w // 2, fuji_y - fuji_h + cap_h + 5)
+            ], fill=(255, 255, 255, 255))
+
+        rng = random.Random(_seed("wasteland", "mountains") if season == "wasteland" else _seed("mountains"))
+        mx = -60
+        while mx < W + 60:
+            if season == "wasteland":
+                # Rock Pillars and Plateaus
+                if rng.random() > 0.6: # Plateau
+                    pw = rng.randint(150, 300)
+                    ph = rng.randint(40, 70)
+                    d.rectangle([mx, SKY_H - ph, mx + pw, SKY_H], fill=c["mtn"] + (255,))
+                    # Jagged top
+                    for j in range(mx, mx + pw, 10):
+                        jy = SKY_H - ph - rng.randint(0, 5)
+                        d.rectangle([j, jy, j+10, SKY_H - ph], fill=c["mtn"] + (255,))
+                    mx += pw
+                else: # Pillar
+                    pw = rng.randint(30, 60)
+                    ph = rng.randint(80, 150)
+                    d.rectangle([mx, SKY_H - ph, mx + pw, SKY_H], fill=c["mtn"] + (255,))
+                    mx += pw + rng.randint(50, 100)
+            else:
+                ph = 28 + rng.randint(-6, 6)
+                bw = 65 + rng.randint(0, 25)
+                d.polygon([(mx, SKY_H), (mx + bw//2, SKY_H - ph), (mx + bw, SKY_H)],
+                          fill=c["mtn"] + (255,))
+                mx += int(bw * 0.65)
+
+    img = Image.new("RGBA", (W, H))
+    _paste_layer(img, baked("sky", draw_sky))
+    d = ImageDraw.Draw(img)
      # ── 3. Trees/Flora (parallax ×0.5) ──────────────────────────────────────────────
+    # Trees are sprites pasted where the layout below puts them. The layout
+    # keeps the original seeds and draw order, including skipping trees out
+    # of view before drawing their height and spring reseeding after each
+    # tree, since which trees show up (and how many) depends on all of it;
+    # the stream is private, so nothing else shifts them.
     t_scroll = frame * (spd // 2 if season == "spring" else 4)
-    random.seed(99)
+    rng = random.Random(99)
     n_trees = W // 10
     if season == "spring":
         n_trees = W // 25
     elif season == "wasteland":
         n_trees = W // 40 # Sparse vegetation
 
+    def draw_cactus(d, tx, ty, arm):
+        d.rectangle([tx, ty-20, tx+4, ty], fill=(40, 100, 40, 255))
+        if arm:
+            d.rectangle([tx+4, ty-15, tx+10, ty-12], fill=(40, 100, 40, 255))
+            d.rectangle([tx+8, ty-18, tx+12, ty-12], fill=(40, 100, 40, 255))
+
+    def draw_tree(d, tx, ty):
+        tw, th = 13, 36
+        d.rectangle([tx, ty - th, tx + tw, ty], fill=c["trunk"] + (255,))
+        lc = c["leaf"] + (255,)
+        d.ellipse([tx-9, ty-th-16, tx+tw//2+1, ty-th+1], fill=lc)
+        d.ellipse([tx+tw//2-6, ty-th-16, tx+tw+9, ty-th+1], fill=lc)
+        d.ellipse([tx-3, ty-th-27, tx+tw+3, ty-th-4], fill=lc)
+
     for _ in range(n_trees):
-        ox = random.randint(-60, W + 350)
+        ox = rng.randint(-60, W + 350)
         tx = ox - t_scroll
         if not (-25 < tx < W + 25):
             continue
-        ty = ROAD_T + random.randint(-6, 8)
-        
+        ty = ROAD_T + rng.randint(-6, 8)
+
         if season == "wasteland":
             # Cacti
-            d.rectangle([tx, ty-20, tx+4, ty], fill=(40, 100, 40, 255))
-            if random.random() > 0.5:
-                # Arm
-                d.rectangle([tx+4, ty-15, tx+10, ty-12], fill=(40, 100, 40, 255))
-                d.rectangle([tx+8, ty-18, tx+12, ty-12], fill=(40, 100, 40, 255))
+            arm = rng.random() > 0.5
+            cactus = _sprite(("cactus", arm), lambda d, x, y: draw_cactus(d, x, y, arm), (0, -20, 13, 1))
+            _paste_sprite(img, cactus, tx, ty)
         else:
-            tw, th = 13, 36
-            d.rectangle([tx, ty - th, tx + tw, ty], fill=c["trunk"] + (255,))
-            lc = c["leaf"] + (255,)
-            d.ellipse([tx-9, ty-th-16, tx+tw//2+1, ty-th+1], fill=lc)
-            d.ellipse([tx+tw//2-6, ty-th-16, tx+tw+9, ty-th+1], fill=lc)
-            d.ellipse([tx-3, ty-th-27, tx+tw+3, ty-th-4], fill=lc)
+            tree = _sprite(("tree", c["trunk"], c["leaf"]), draw_tree, (-9, -63, 23, 1))
+            _paste_sprite(img, tree, tx, ty)
 
             if season == "spring":
-                random.seed(abs(int(ox)) * 7)
+                rng.seed(abs(int(ox)) * 7)
                 for _ in range(4):
-                    px = tx + random.randint(-40, 60) - (frame * 0.5)
-                    py = ty - random.randint(-10, 40) + (frame * 1.5)
+                    px = tx + rng.randint(-40, 60) - (frame * 0.5)
+                    py = ty - rng.randint(-10, 40) + (frame * 1.5)
                     d.point((int(px), int(py)), fill=(255, 105, 180, 200))
+
      # ── 4. Season-specific atmosphere ─────────────────────────────────────────
 
     # SPRING – Very slow wind lines + pink petals
     if season == "spring":
         # Slow down wind lines speed further
         p_shift = frame * 3
-        random.seed(333)
+        rng = random.Random(_seed("spring", "wind"))
         for _ in range(W // 25):
-            ox0 = random.randint(-120, W)
-            oy  = random.randint(5, SLOPE_B - 20)
+            ox0 = rng.randint(-120, W)
+            oy  = rng.randint(5, SLOPE_B - 20)
             wx  = (ox0 + p_shift * 1.5) % (W + 120) - 60
             d.line([wx, oy, wx + 40, oy], fill=(255, 255, 255, 70), width=1)
         
         # Drift even more slowly: 1 pixel per frame
-        random.seed(9999)
+        rng = random.Random(_seed("spring", "drift"))
         for _ in range(W // 8):
-            ox0 = random.randint(-200, W + 200)
-            oy0 = random.randint(-50, H + 50)
+            ox0 = rng.randint(-200, W + 200)
+            oy0 = rng.randint(-50, H + 50)
             # Drift very slowly: 1 pixel per frame left, 0.5 pixels down
             px = (ox0 - frame * 1) % W
             py = (oy0 + frame * 0.5 + math.sin(frame * 0.3 + ox0) * 4) % H
             # Varied pink shades
-            p_col = random.choice([(255, 182, 193, 160), (255, 105, 180, 140), (255, 192, 203, 120)])
+            p_col = rng.choice([(255, 182, 193, 160), (255, 105, 180, 140), (255, 192, 203, 120)])
             d.rectangle([px, py, px+1, py+1], fill=p_col)
 
     # SUMMER – heat shimmer dots + golden pollen
     elif season == "summer":
-        random.seed(frame * 5 + 2)
-        for _ in range(W // 6):
-            dx, dy = random.randint(0, W), random.randint(0, H)
-            d.point((dx, dy), fill=(255, 255, 180, 130))
+        rng = random.Random(_seed("summer", "pollen", frame))
+        # Scatters of single-pixel points in one color are handed to ImageDraw
+        # in one call per field instead of one per point
+        d.point([(rng.randint(0, W), rng.randint(0, H)) for _ in range(W // 6)],
+                fill=(255, 255, 180, 130))
         # Subtle horizontal shimmer lines near road
-        random.seed(frame + 77)
+        rng = random.Random(_seed("summer", "shimmer", frame))
         for _ in range(8):
-            sy = random.randint(ROAD_T + 2, ROAD_B - 2)
-            sx = random.randint(0, W - 40)
-            d.line([sx, sy, sx + random.randint(15, 40), sy],
+            sy = rng.randint(ROAD_T + 2, ROAD_B - 2)
+            sx = rng.randint(0, W - 40)
+            d.line([sx, sy, sx + rng.randint(15, 40), sy],
                    fill=(255, 255, 255, 60), width=1)
 
     # AUTUMN – falling leaves + gentle wind
     elif season == "autumn":
         wshift = frame * 10
-        random.seed(444)
+        rng = random.Random(_seed("autumn", "wind"))
         for _ in range(W // 28):
-            wx0 = random.randint(-80, W)
-            wy  = random.randint(5, SLOPE_B)
+            wx0 = rng.randint(-80, W)
+            wy  = rng.randint(5, SLOPE_B)
             wx  = (wx0 + wshift) % (W + 80) - 40
             d.line([wx, wy, wx + 20, wy + 3], fill=(255, 200, 100, 90), width=1)
         # Falling leaf dots
-        random.seed(frame * 7 + 3)
+        rng = random.Random(_seed("autumn", "leaves", frame))
         for _ in range(W // 12):
-            lx = random.randint(0, W)
-            ly = random.randint(0, SLOPE_B)
-            leaf_col = random.choice([
+            lx = rng.randint(0, W)
+            ly = rng.randint(0, SLOPE_B)
+            leaf_col = rng.choice([
                 (255, 69, 0, 200), (210, 105, 30, 200), (255, 165, 0, 200)
             ])
             d.rectangle([lx, ly, lx+2, ly+2], fill=leaf_col)
@@ -265,115 +359,126 @@ def draw_scene(season, frame, W=1200, H=320):
     # WINTER – snowflakes
     elif season == "winter":
         # Snowflakes
-        random.seed(frame * 11 + 4)
-        for _ in range(W // 20):
-            sx = random.randint(0, W)
-            sy = (random.randint(0, H) + frame * 3) % H
-            d.point((sx, sy), fill=(255, 255, 255, 220))
+        rng = random.Random(_seed("winter", "snow", frame))
+        d.point([(rng.randint(0, W), (rng.randint(0, H) + frame * 3) % H) for _ in range(W // 20)],
+                fill=(255, 255, 255, 220))
             
     # WASTELAND – Dust Storm
     elif season == "wasteland":
-        random.seed(frame * 2)
+        rng = random.Random(_seed("wasteland", "dust", frame))
         for _ in range(W // 10):
-            dx = random.randint(0, W)
-            dy = random.randint(0, H)
-            size = random.randint(1, 3)
+            dx = rng.randint(0, W)
+            dy = rng.randint(0, H)
+            size = rng.randint(1, 3)
             d.rectangle([dx, dy, dx+size, dy+1], fill=(210, 180, 140, 100))
      # 5. Road ───────────────────────────────────────────────────────────────
-    d.rectangle([0, ROAD_T, W, ROAD_B], fill=c["road"] + (255,))
-    random.seed(123)
-    for _ in range(W * 2):
-        ox = random.randint(-W, W * 2)
-        ry = random.randint(ROAD_T, ROAD_B)
-        rx = (ox - shift) % W
-        shade = random.choice([(55, 55, 55), (115, 115, 115)])
-        d.point((rx, ry), fill=shade + (255,))
-    d.line([0, ROAD_B, W, ROAD_B], fill=(40, 40, 40, 255), width=2)
-# Removed duplicate line 177: d.line([0, ROAD_B, W, ROAD_B], fill=(40, 40, 40, 255), width=2)
+    # Layers scrolling by shift are baked twice as wide as the frame with
+    # every element drawn at x and x + W, so the frame is the slice starting
+    # at shift % W
+    def draw_road(d):
+        d.rectangle([0, ROAD_T, W * 2, ROAD_B], fill=c["road"] + (255,))
+        rng = random.Random(_seed("gravel"))
+        for _ in range(W * 2):
+            ox = rng.randint(-W, W * 2)
+            ry = rng.randint(ROAD_T, ROAD_B)
+            shade = rng.choice([(55, 55, 55), (115, 115, 115)])
+            for rx in (ox % W, ox % W + W):
+                d.point((rx, ry), fill=shade + (255,))
+
+    _paste_layer(img, baked("road", draw_road, W * 2), shift % W)
 
     # ── 6. Slope ──────────────────────────────────────────────────────────────
-    steps = 18
-    sh = (SLOPE_B - ROAD_B) / steps
-    for i in range(steps):
-        sy = ROAD_B + i * sh
-        ey = sy + sh + 1
-        f  = i / steps
-        r, g, b = c["grass"]
-        si = 0.5 * (1 - f)
-        d.rectangle([0, sy, W, ey],
-                    fill=(int(r*(1-si)), int(g*(1-si)), int(b*(1-si)), 255))
-    d.line([0, ROAD_B, W, ROAD_B], fill=(200, 200, 200, 90), width=1)
-
-    if season not in ["winter", "wasteland"]:
-        random.seed(42)
-        for _ in range(W // 4):
-            ox = random.randint(0, W)
-            fy = random.randint(ROAD_B + 2, SLOPE_B - 2)
-            fx = (ox - shift) % W
-            d.rectangle([fx, fy, fx+2, fy+2], fill=c["flower"] + (255,))
-            d.line([fx+5, fy, fx+5, fy-4], fill=c["shade"] + (255,), width=1)
-    elif season == "wasteland":
+    def draw_slope(d):
+        d.line([0, ROAD_B, W * 2, ROAD_B], fill=(40, 40, 40, 255), width=2)
+        steps = 18
+        sh = (SLOPE_B - ROAD_B) / steps
+        for i in range(steps):
+            sy = ROAD_B + i * sh
+            ey = sy + sh + 1
+            f  = i / steps
+            r, g, b = c["grass"]
+            si = 0.5 * (1 - f)
+            d.rectangle([0, sy, W * 2, ey],
+                        fill=(int(r*(1-si)), int(g*(1-si)), int(b*(1-si)), 255))
+        d.line([0, ROAD_B, W * 2, ROAD_B], fill=(200, 200, 200, 90), width=1)
+
+        if season not in ["winter", "wasteland"]:
+            rng = random.Random(_seed("flowers"))
+            for _ in range(W // 4):
+                ox = rng.randint(0, W)
+                fy = rng.randint(ROAD_B + 2, SLOPE_B - 2)
+                for fx in (ox % W, ox % W + W):
+                    d.rectangle([fx, fy, fx+2, fy+2], fill=c["flower"] + (255,))
+                    d.line([fx+5, fy, fx+5, fy-4], fill=c["shade"] + (255,), width=1)
+        elif season == "winter":
+            # Snow on slope
+            rng = random.Random(_seed("winter", "slope snow"))
+            for _ in range(W // 6):
+                ox = rng.randint(0, W)
+                fy = rng.randint(ROAD_B + 1, SLOPE_B - 1)
+                for fx in (ox % W, ox % W + W):
+                    d.point((fx, fy), fill=(255, 255, 255, 200))
+
+    _paste_layer(img, baked("slope", draw_slope, W * 2), shift % W)
+
+    if season == "wasteland":
         # Sand texture
-        random.seed(shift)
-        for _ in range(W // 2):
-            fx = random.randint(0, W)
-            fy = random.randint(ROAD_B, SLOPE_B)
-            d.point((fx, fy), fill=(139, 69, 19, 100))
-    else:
-        # Snow on slope
-        random.seed(77)
-        for _ in range(W // 6):
-            ox = random.randint(0, W)
-            fy = random.randint(ROAD_B + 1, SLOPE_B - 1)
-            fx = (ox - shift) % W
-            d.point((fx, fy), fill=(255, 255, 255, 200))
+        rng = random.Random(_seed("wasteland", "sand", frame))
+        d.point([(rng.randint(0, W), rng.randint(ROAD_B, SLOPE_B)) for _ in range(W // 2)],
+                fill=(139, 69, 19, 100))
 
     if season == "wasteland": # No river in wasteland
-        d.rectangle([0, SLOPE_B, W, H], fill=c["road"] + (255,))
-        random.seed(77)
-        for _ in range(W // 2):
-            fx = random.randint(0, W)
-            fy = random.randint(SLOPE_B, H)
-            d.point((fx, fy), fill=(139, 69, 19, 80))
-            
+        def draw_ground(d):
+            d.rectangle([0, SLOPE_B, W, H], fill=c["road"] + (255,))
+            rng = random.Random(_seed("wasteland", "ground"))
+            for _ in range(W // 2):
+                fx = rng.randint(0, W)
+                fy = rng.randint(SLOPE_B, H)
+                d.point((fx, fy), fill=(139, 69, 19, 80))
+
+        _paste_layer(img, baked("ground", draw_ground))
+
         # ── Thor's Hammer (Mjolnir) Easter Egg ──
-        hammer_ox = W // 2 + 150
-        hx = (hammer_ox - shift + W * 4) % W
-        hy = SLOPE_B + 20
-        
-        # Dirt crater/mound around the hammer
-        d.ellipse([hx - 25, hy - 6, hx + 25, hy + 8], fill=(120, 60, 15, 255))
-        d.ellipse([hx - 15, hy - 3, hx + 15, hy + 6], fill=(90, 40, 10, 255))
-        
-        # Mjolnir Head
-        d.polygon([
-            (hx - 10, hy - 10), (hx + 6, hy - 16), 
-            (hx + 14, hy + 2), (hx - 2, hy + 8)
-        ], fill=(160, 160, 160, 255))
-        
-        # Side bevel lighting for 3D effect
-        d.polygon([
-            (hx - 10, hy - 10), (hx - 2, hy + 8),
-            (hx + 2, hy + 6), (hx - 6, hy - 11)
-        ], fill=(120, 120, 120, 255))
-        
-        # Handle pointing UP and slightly RIGHT from the top-center face
-        hx_center, hy_center = hx + 2, hy - 7
-        hx_end, hy_end = hx + 12, hy - 32
-        
-        d.line([(hx_center, hy_center), (hx_end, hy_end)], fill=(90, 45, 10, 255), width=4)
-        
-        # Handle ridges (leather wrap)
-        for i in range(1, 6):
-            lx = hx_center + int((hx_end - hx_center) * (i / 6.0))
-            ly = hy_center + int((hy_end - hy_center) * (i / 6.0))
-            d.line([(lx-3, ly+1), (lx+3, ly-1)], fill=(50, 25, 5, 255), width=1)
-            
-        # Pommel at the top of the handle
-        d.ellipse([hx_end - 3, hy_end - 4, hx_end + 3, hy_end + 2], fill=(180, 180, 180, 255))
-        
-        # Leather strap dangling downwards
-        d.arc([hx_end, hy_end, hx_end + 12, hy_end + 15], start=45, end=250, fill=(100, 50, 10, 255), width=1)
+        def draw_mjolnir(d):
+            hammer_ox = W // 2 + 150
+            for hx in (hammer_ox % W, hammer_ox % W + W):
+                hy = SLOPE_B + 20
+
+                # Dirt crater/mound around the hammer
+                d.ellipse([hx - 25, hy - 6, hx + 25, hy + 8], fill=(120, 60, 15, 255))
+                d.ellipse([hx - 15, hy - 3, hx + 15, hy + 6], fill=(90, 40, 10, 255))
+
+                # Mjolnir Head
+                d.polygon([
+                    (hx - 10, hy - 10), (hx + 6, hy - 16),
+                    (hx + 14, hy + 2), (hx - 2, hy + 8)
+                ], fill=(160, 160, 160, 255))
+
+                # Side bevel lighting for 3D effect
+                d.polygon([
+                    (hx - 10, hy - 10), (hx - 2, hy + 8),
+                    (hx + 2, hy + 6), (hx - 6, hy - 11)
+                ], fill=(120, 120, 120, 255))
+
+                # Handle pointing UP and slightly RIGHT from the top-center face
+                hx_center, hy_center = hx + 2, hy - 7
+                hx_end, hy_end = hx + 12, hy - 32
+
+                d.line([(hx_center, hy_center), (hx_end, hy_end)], fill=(90, 45, 10, 255), width=4)
+
+                # Handle ridges (leather wrap)
+                for i in range(1, 6):
+                    lx = hx_center + int((hx_end - hx_center) * (i / 6.0))
+                    ly = hy_center + int((hy_end - hy_center) * (i / 6.0))
+                    d.line([(lx-3, ly+1), (lx+3, ly-1)], fill=(50, 25, 5, 255), width=1)
+
+                # Pommel at the top of the handle
+                d.ellipse([hx_end - 3, hy_end - 4, hx_end + 3, hy_end + 2], fill=(180, 180, 180, 255))
+
+                # Leather strap dangling downwards
+                d.arc([hx_end, hy_end, hx_end + 12, hy_end + 15], start=45, end=250, fill=(100, 50, 10, 255), width=1)
+
+        _paste_layer(img, baked("mjolnir", draw_mjolnir, W * 2), shift % W)
             
         # ── Flying Warriors ──────────
         stage = min(4, frame // 3)
@@ -386,17 +491,21 @@ def draw_scene(season, frame, W=1200, H=320):
         ]
         
         def draw_warrior(x, y, char_stage, is_char1, f, force_dir=None):
+            dr = force_dir if force_dir is not None else (1 if is_char1 else -1)
+            pose = (f // 3 + (1 if is_char1 else 0)) % 3
+            sprite = _sprite(("warrior", char_stage, is_char1, pose, dr),
+                             lambda d, x, y: draw_warrior_pose(d, x, y, char_stage, is_char1, pose, dr), (-40, -80, 41, 34))
+            _paste_sprite(img, sprite, x, y)
+
+        def draw_warrior_pose(d, x, y, char_stage, is_char1, pose, dr):
             suit = (255, 120, 0, 255) if is_char1 else (0, 80, 200, 255)
             skin = (255, 210, 170, 255)
             h_col = hair_colors[char_stage]
             aura_rgb = h_col[:3]
-            dr = force_dir if force_dir is not None else (1 if is_char1 else -1)
 
             # Aura removed by user request
 
             # --- FIGHTING STANCE (MUSCULAR, VARIED POSES) ---
-            pose = (f // 3 + (1 if is_char1 else 0)) % 3
-
             if pose == 0:
                 # Pose 0: Standard Punch
                 # Front leg
@@ -520,25 +629,22 @@ def draw_scene(season, frame, W=1200, H=320):
                 ], fill=h_col)
 
         # --- Fast Teleporting Combat in the Sky ---
-        rng_state = random.getstate()
-        
         # New pose/position every 3 frames (stay static for 2 frames, invisible for 1)
-        pose_seed = frame // 3
-        random.seed(pose_seed + 888)
+        rng = random.Random(_seed("wasteland", "warriors", frame // 3))
         
         # Make them invisible 1 out of every 3 frames to look incredibly fast
         is_visible = (frame % 3) != 2 
         
         if is_visible:
             # Pick a random clash point
-            cx = random.randint(250, W - 250)
-            cy = random.randint(60, SKY_H - 60)
+            cx = rng.randint(250, W - 250)
+            cy = rng.randint(60, SKY_H - 60)
             
             # Distance between them
-            dist = random.randint(70, 220)
+            dist = rng.randint(70, 220)
             
             # 50% chance to swap sides
-            swapped = random.random() > 0.5
+            swapped = rng.random() > 0.5
             dr1 = -1 if swapped else 1
             dr2 = 1 if swapped else -1
             
@@ -547,14 +653,14 @@ def draw_scene(season, frame, W=1200, H=320):
             c2_x = cx - (dist // 2) * dr2
             
             # Draw warriors with small vertical offsets
-            draw_warrior(c1_x, cy + random.randint(-15, 15), stage, True, frame, force_dir=dr1)
+            draw_warrior(c1_x, cy + rng.randint(-15, 15), stage, True, frame, force_dir=dr1)
             c2_stage = 1 if stage == 2 else stage
-            draw_warrior(c2_x, cy + random.randint(-15, 15), c2_stage, False, frame, force_dir=dr2)
+            draw_warrior(c2_x, cy + rng.randint(-15, 15), c2_stage, False, frame, force_dir=dr2)
             
             # Combat effects depending on distance
             if dist <= 120 and (frame % 3) == 0:
                 # Close quarters: physical impact flash (hit!)
-                flash_r = random.randint(30, 60)
+                flash_r = rng.randint(30, 60)
                 # Draw starburst
                 d.polygon([
                     (cx, cy - flash_r), (cx + flash_r//4, cy - flash_r//4),
@@ -566,7 +672,7 @@ def draw_scene(season, frame, W=1200, H=320):
                 d.ellipse([cx-15, cy-15, cx+15, cy+15], fill=(255, 255, 0, 255))
             elif dist > 140 and (frame % 3) == 0:
                 # Long range: Ki blast!
-                if random.random() > 0.5:
+                if rng.random() > 0.5:
                     # Blast from Char 1 to Char 2
                     blast_col = hair_colors[stage]
                     d.line([c1_x + dr1*20, cy, cx + dr1*40, cy], fill=blast_col[:3] + (200,), width=12)
@@ -584,35 +690,40 @@ def draw_scene(season, frame, W=1200, H=320):
                     bx = cx + dr2*40
                     d.ellipse([bx-12, cy-12, bx+12, cy+12], fill=blast_col[:3] + (255,))
                     d.ellipse([bx-6, cy-6, bx+6, cy+6], fill=(255,255,255,255))
-        
-        random.setstate(rng_state)
     
     if season != "wasteland":
         # ── 7. River ──────────────────────────────────────────────────────────────
-        d.rectangle([0, SLOPE_B, W, H], fill=c["river"] + (255,))
         rflow = 0 if season == "winter" else frame * 10
-        random.seed(55)
-        for _ in range(W // 5):
-            ox = random.randint(0, W)
-            ry = random.randint(SLOPE_B + 2, H - 2)
-            lw = random.randint(10, 35)
-            lx = (ox - rflow) % W
-            d.line([lx, ry, lx + lw, ry], fill=(255, 255, 255, 110), width=1)
+
+        def draw_river(d):
+            d.rectangle([0, SLOPE_B, W * 2, H], fill=c["river"] + (255,))
+            rng = random.Random(_seed("ripples"))
+            for _ in range(W // 5):
+                ox = rng.randint(0, W)
+                ry = rng.randint(SLOPE_B + 2, H - 2)
+                lw = rng.randint(10, 35)
+                for lx in (ox % W, ox % W + W):
+                    d.line([lx, ry, lx + lw, ry], fill=(255, 255, 255, 110), width=1)
+
+        _paste_layer(img, baked("river", draw_river, W * 2), rflow % W)
         if season == "winter":
-            # Ice cracks
-            random.seed(88)
-            for _ in range(W // 30):
-                ix = random.randint(0, W)
-                iy = random.randint(SLOPE_B + 2, H - 2)
-                d.line([ix, iy, ix + random.randint(5, 15), iy + random.randint(-2, 2)],
-                       fill=(200, 230, 255, 150), width=1)
+            def draw_ice(d):
+                # Ice cracks
+                rng = random.Random(_seed("winter", "ice"))
+                for _ in range(W // 30):
+                    ix = rng.randint(0, W)
+                    iy = rng.randint(SLOPE_B + 2, H - 2)
+                    d.line([ix, iy, ix + rng.randint(5, 15), iy + rng.randint(-2, 2)],
+                           fill=(200, 230, 255, 150), width=1)
+
+            _paste_layer(img, baked("ice", draw_ice))
                        
         # ── 7.5 River Activities ──────────────────────────────────────────────────
         if season in ["spring", "summer"] and (6 <= hour < 19):
             # People fishing
-            random.seed(999) 
+            rng = random.Random(_seed("anglers"))
             for _ in range(3):
-                ox = random.randint(0, W * 2)
+                ox = rng.randint(0, W * 2)
                 fx = (ox - shift) % W
                 fy = SLOPE_B - 20
                 # Person sitting
@@ -632,10 +743,10 @@ def draw_scene(season, frame, W=1200, H=320):
                 
         elif season == "autumn":
             # Fish jumping
-            random.seed(frame * 17)
+            rng = random.Random(_seed("autumn", "fish", frame))
             for _ in range(3):
-                jx = random.randint(0, W)
-                jy = random.randint(SLOPE_B + 20, H - 20)
+                jx = rng.randint(0, W)
+                jy = rng.randint(SLOPE_B + 20, H - 20)
                 
                 # Simple fish shape
                 d.ellipse([jx, jy-8, jx+16, jy+2], fill=(180, 200, 200, 255)) # Body
@@ -658,27 +769,32 @@ def draw_scene(season, frame, W=1200, H=320):
                 (2,4),(3,4),(4,4),
                 (3,5),
             ]
-            for px, py in pattern:
-                rx = hx + (px - 3) * size
-                ry = hy + (py - 3) * size
-                d.rectangle([rx, ry, rx + size - 1, ry + size - 1], fill=color)
 
-        def draw_broken_heart(hx, hy, progress, size=2):
-            # Left half drifts upper-left, right half drifts upper-right
+            def draw(d, hx, hy):
+                for px, py in pattern:
+                    rx = hx + (px - 3) * size
+                    ry = hy + (py - 3) * size
+                    d.rectangle([rx, ry, rx + size - 1, ry + size - 1], fill=color)
+
+            _paste_sprite(img, _sprite(("heart", size, color), draw, (-3 * size, -3 * size, 4 * size, 3 * size)), hx, hy)
+
+        def draw_broken_heart(hx, hy, drift, rise, color, size=2):
+            # Left half drifts `drift` px left, right half as far right, both rise `rise` px
             left_half = [(0,0),(1,0),(0,1),(1,1),(2,1),(0,2),(1,2),(2,2),(1,3),(2,3),(2,4)]
             right_half = [(4,0),(5,0),(3,1),(4,1),(5,1),(6,1),(3,2),(4,2),(5,2),(6,2),(4,3),(5,3),(3,4),(4,4),(3,5)]
-            drift = int(progress * 8 * size)
-            rise  = int(progress * 5 * size)
-            fade  = max(0, int(255 * (1 - progress)))
-            col   = (255, 60, 60, fade)
-            for px, py in left_half:
-                rx = hx + (px - 3) * size - drift
-                ry = hy + (py - 3) * size - rise
-                d.rectangle([rx, ry, rx + size - 1, ry + size - 1], fill=col)
-            for px, py in right_half:
-                rx = hx + (px - 3) * size + drift
-                ry = hy + (py - 3) * size - rise
-                d.rectangle([rx, ry, rx + size - 1, ry + size - 1], fill=col)
+
+            def draw(d, hx, hy):
+                for px, py in left_half:
+                    rx = hx + (px - 3) * size - drift
+                    ry = hy + (py - 3) * size - rise
+                    d.rectangle([rx, ry, rx + size - 1, ry + size - 1], fill=color)
+                for px, py in right_half:
+                    rx = hx + (px - 3) * size + drift
+                    ry = hy + (py - 3) * size - rise
+                    d.rectangle([rx, ry, rx + size - 1, ry + size - 1], fill=color)
+
+            box = (-3 * size - drift, -3 * size - rise, 4 * size + drift, 3 * size - rise)
+            _paste_sprite(img, _sprite(("broken heart", size, drift, rise, color), draw, box), hx, hy)
 
         if season in ["spring", "summer"] and (6 <= hour < 19):
             # Fixed couples: one crosses avatar mid-animation, other stays right of screen
@@ -791,62 +907,71 @@ def draw_scene(season, frame, W=1200, H=320):
 
     # Walk cycle
     t = (frame % 8) / 8.0
-    hip_x, hip_y = cx, foot - 22
-
-    r_leg = 35 * math.sin(t * 2 * math.pi)
-    l_leg = 35 * math.sin(t * 2 * math.pi + math.pi)
-
-    def leg(hx, hy, angle, col):
-        rad = math.radians(angle)
-        kx = hx + 8 * math.sin(rad)
-        ky = hy + 8 * math.cos(rad)
-        d.line([hx, hy, kx, ky], fill=col, width=6)   # thigh
-        bend = -12 if angle > 0 else 0
-        rad2 = math.radians(angle + bend)
-        fx = kx + 9 * math.sin(rad2)
-        fy = ky + 9 * math.cos(rad2)
-        d.line([kx, ky, fx, fy], fill=col, width=4)   # calf
-
-    # Back leg
-    leg(hip_x, hip_y, l_leg, blue_jeans)
-
-    # Body
-    d.rectangle([cx-7, hip_y-17, cx+7, hip_y], fill=shirt)
-
-    # Front leg
-    leg(hip_x, hip_y, r_leg, blue_jeans)
-
-    # Head
+    hip_y = foot - 22
     hy2 = hip_y - 28
-    d.rectangle([cx-6, hy2, cx+6, hy2+11], fill=skin + (255,))
-    d.rectangle([cx-7, hy2-3, cx+7, hy2+4], fill=hair + (255,))
-    d.rectangle([cx-7, hy2, cx-5, hy2+9], fill=hair + (255,))
-
-    # Arm (right, swings opposite to right leg)
-    r_arm = 35 * math.sin(t * 2 * math.pi + math.pi)
     sho_y = hip_y - 13
-    rad_a = math.radians(r_arm)
-    ex = cx + 5 * math.sin(rad_a)
-    ey = sho_y + 5 * math.cos(rad_a)
-    d.line([cx, sho_y, ex, ey], fill=shirt, width=4)
-    hx2 = ex + 5 * math.sin(rad_a - 0.2)
-    hy3 = ey + 5 * math.cos(rad_a - 0.2)
-    d.line([ex, ey, hx2, hy3], fill=skin + (255,), width=3)
-
-    # ── Props ─────────────────────────────────────────────────────────────────
-    # Walkman (small blue rectangle on hip)
-    wm_x, wm_y = cx + 4, hip_y - 10
-    d.rectangle([wm_x, wm_y, wm_x + 4, wm_y + 6], fill=(20, 40, 150, 255)) # Blue Walkman
+
+    # The walker and props only change with the walk phase and shirt color, so
+    # each phase is drawn once around (cx, foot) and pasted (see _sprite)
+    def draw_walker(d, cx, foot):
+        hip_x, hip_y = cx, foot - 22
+
+        r_leg = 35 * math.sin(t * 2 * math.pi)
+        l_leg = 35 * math.sin(t * 2 * math.pi + math.pi)
+
+        def leg(hx, hy, angle, col):
+            rad = math.radians(angle)
+            kx = hx + 8 * math.sin(rad)
+            ky = hy + 8 * math.cos(rad)
+            d.line([hx, hy, kx, ky], fill=col, width=6)   # thigh
+            bend = -12 if angle > 0 else 0
+            rad2 = math.radians(angle + bend)
+            fx = kx + 9 * math.sin(rad2)
+            fy = ky + 9 * math.cos(rad2)
+            d.line([kx, ky, fx, fy], fill=col, width=4)   # calf
+
+        # Back leg
+        leg(hip_x, hip_y, l_leg, blue_jeans)
+
+        # Body
+        d.rectangle([cx-7, hip_y-17, cx+7, hip_y], fill=shirt)
+
+        # Front leg
+        leg(hip_x, hip_y, r_leg, blue_jeans)
+
+        # Head
+        hy2 = hip_y - 28
+        d.rectangle([cx-6, hy2, cx+6, hy2+11], fill=skin + (255,))
+        d.rectangle([cx-7, hy2-3, cx+7, hy2+4], fill=hair + (255,))
+        d.rectangle([cx-7, hy2, cx-5, hy2+9], fill=hair + (255,))
+
+        # Arm (right, swings opposite to right leg)
+        r_arm = 35 * math.sin(t * 2 * math.pi + math.pi)
+        sho_y = hip_y - 13
+        rad_a = math.radians(r_arm)
+        ex = cx + 5 * math.sin(rad_a)
+        ey = sho_y + 5 * math.cos(rad_a)
+        d.line([cx, sho_y, ex, ey], fill=shirt, width=4)
+        hx2 = ex + 5 * math.sin(rad_a - 0.2)
+        hy3 = ey + 5 * math.cos(rad_a - 0.2)
+        d.line([ex, ey, hx2, hy3], fill=skin + (255,), width=3)
+
+        # ── Props ─────────────────────────────────────────────────────────────
+        # Walkman (small blue rectangle on hip)
+        wm_x, wm_y = cx + 4, hip_y - 10
+        d.rectangle([wm_x, wm_y, wm_x + 4, wm_y + 6], fill=(20, 40, 150, 255)) # Blue Walkman
     
-    # Headphones (headband and ear cups)
-    # Headband
-    d.arc([cx-7, hy2-4, cx+7, hy2+4], start=180, end=0, fill=(40, 40, 40, 255), width=2)
-    # Ear cups
-    d.rectangle([cx-8, hy2+4, cx-5, hy2+9], fill=(20, 20, 20, 255))
-    d.rectangle([cx+5, hy2+4, cx+8, hy2+9], fill=(20, 20, 20, 255))
+        # Headphones (headband and ear cups)
+        # Headband
+        d.arc([cx-7, hy2-4, cx+7, hy2+4], start=180, end=0, fill=(40, 40, 40, 255), width=2)
+        # Ear cups
+        d.rectangle([cx-8, hy2+4, cx-5, hy2+9], fill=(20, 20, 20, 255))
+        d.rectangle([cx+5, hy2+4, cx+8, hy2+9], fill=(20, 20, 20, 255))
     
-    # Wire (from walkman to ear cup)
-    d.line([wm_x + 2, wm_y, cx + 6, hy2 + 7], fill=(30, 30, 30, 180), width=1)
+        # Wire (from walkman to ear cup)
+        d.line([wm_x + 2, wm_y, cx + 6, hy2 + 7], fill=(30, 30, 30, 180), width=1)
+
+    _paste_sprite(img, _sprite(("walker", shirt, frame % 8), draw_walker, (-24, -58, 24, 2)), cx, foot)
 
     # Music notes OR breaking heart depending on proximity to couple
     if season != "wasteland":
@@ -870,30 +995,11 @@ def draw_scene(season, frame, W=1200, H=320):
             if couple_prox >= 0.55:
                 # Break: left half drifts left+up, right half drifts right+up
                 bp = min(1.0, (couple_prox - 0.55) / 0.45)
-                drift = int(bp * 10)
-                rise  = int(bp * 6)
-                fade  = max(0, int(220 * (1 - bp)))
-                col   = (255, 60, 60, fade)
-                lh = [(0,0),(1,0),(0,1),(1,1),(2,1),(0,2),(1,2),(2,2),(1,3),(2,3),(2,4)]
-                rh = [(4,0),(5,0),(3,1),(4,1),(5,1),(6,1),(3,2),(4,2),(5,2),(6,2),(4,3),(5,3),(3,4),(4,4),(3,5)]
-                for px, py in lh:
-                    rx = hx + (px - 3) * 2 - drift
-                    ry = hy_base + (py - 3) * 2 - rise
-                    d.rectangle([rx, ry, rx + 1, ry + 1], fill=col)
-                for px, py in rh:
-                    rx = hx + (px - 3) * 2 + drift
-                    ry = hy_base + (py - 3) * 2 - rise
-                    d.rectangle([rx, ry, rx + 1, ry + 1], fill=col)
+                fade = max(0, int(220 * (1 - bp)))
+                draw_broken_heart(hx, hy_base, int(bp * 10), int(bp * 6), (255, 60, 60, fade))
             else:
                 # Solid heart rising toward the couple
-                alpha = int(220 * couple_prox)
-                pattern = [(1,0),(2,0),(4,0),(5,0),(0,1),(1,1),(2,1),(3,1),(4,1),(5,1),(6,1),
-                           (0,2),(1,2),(2,2),(3,2),(4,2),(5,2),(6,2),(1,3),(2,3),(3,3),(4,3),(5,3),
-                           (2,4),(3,4),(4,4),(3,5)]
-                for px, py in pattern:
-                    rx = hx + (px - 3) * 2
-                    ry = hy_base + (py - 3) * 2
-                    d.rectangle([rx, ry, rx + 1, ry + 1], fill=(255, 80, 100, alpha))
+                draw_pixel_heart(hx, hy_base, color=(255, 80, 100, int(220 * couple_prox)))
         else:
             # Normal: music notes float upward
             for i in range(2):
@@ -919,7 +1025,6 @@ def draw_scene(season, frame, W=1200, H=320):
 
     if season == "wasteland":
         # ── Greeting Speech Bubble ──
-        hour = get_current_hour()
         
         # Unique 24-hour thematic dialogs
         # Format: {hour: (Base Greeting, Additional Dialog)}
@@ -952,24 +1057,28 @@ def draw_scene(season, frame, W=1200, H=320):
         
         base, extra = hour_data.get(hour, ("Hello visitor.", "Keep on walking."))
         greeting = f"{base} {extra}"
-            
-        # Draw bubble near head
+
+        # Same bubble all hour: measured and drawn once around (cx, hy2)
         try:
-            text_w = d.textlength(greeting)
+            text_w = ImageDraw.Draw(Image.new("RGBA", (1, 1))).textlength(greeting)
         except AttributeError:
             text_w = len(greeting) * 7
-            
-        bx = cx - 20
-        by = hy2 - 35
-        bubble_w = text_w + 10
-        bubble_h = 18
-        
-        # Speech bubble background
-        d.rectangle([bx, by, bx + bubble_w, by + bubble_h], fill=(255, 255, 255, 220), outline=(0,0,0,180))
-        # tail
-        d.polygon([(cx, by + bubble_h), (cx + 10, by + bubble_h), (cx + 5, by + bubble_h + 6)], fill=(255, 255, 255, 220))
-        # Text
-        d.text((bx + 5, by + 2), greeting, fill=(0, 0, 0, 255))
+
+        def draw_bubble(d, cx, hy2):
+            # Draw bubble near head
+            bx = cx - 20
+            by = hy2 - 35
+            bubble_w = text_w + 10
+            bubble_h = 18
+
+            # Speech bubble background
+            d.rectangle([bx, by, bx + bubble_w, by + bubble_h], fill=(255, 255, 255, 220), outline=(0,0,0,180))
+            # tail
+            d.polygon([(cx, by + bubble_h), (cx + 10, by + bubble_h), (cx + 5, by + bubble_h + 6)], fill=(255, 255, 255, 220))
+            # Text
+            d.text((bx + 5, by + 2), greeting, fill=(0, 0, 0, 255))
+
+        _paste_sprite(img, _sprite(("bubble", greeting), draw_bubble, (-24, -38, max(math.ceil(text_w) - 8, 11), -8)), cx, hy2)
 
     # ── Final Atmosphere Overlay ──
     if atmosphere_tint[3] > 0:
@@ -979,22 +1088,56 @@ def draw_scene(season, frame, W=1200, H=320):
     return img
 
 
+SEASONS = ["spring", "summer", "autumn", "winter", "wasteland"]
+FRAMES_PER_SEASON = 16
+
+
+def _draw_season(season, hour):
+    # Process-pool worker for all_frames(): every frame of one season, so the
+    # worker bakes that season's layers once. Frames go back as (mode, size,
+    # raw bytes) for Image.frombytes.
+    frames = (draw_scene(season, i, H=320, hour=hour) for i in range(FRAMES_PER_SEASON))
+    return [(img.mode, img.size, img.tobytes()) for img in frames]
+
+
+def all_frames(workers=1):
+    # The hour is read once, so a run that crosses the hour doesn't switch
+    # lighting halfway. With more than one worker each season is drawn in its
+    # own process and the frames are yielded back in order; every layer has
+    # its own random stream (see _seed), so they match the serial run.
+    hour = get_current_hour()
+    if workers <= 1:
+        for season in SEASONS:
+            for i in range(FRAMES_PER_SEASON):
+                yield draw_scene(season, i, H=320, hour=hour)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_draw_season, season, hour) for season in SEASONS]
+        for future in futures:
+            for mode, size, data in future.result():
+                yield Image.frombytes(mode, size, data)
+
+
 if __name__ == "__main__":
-    frames = []
-    for season in ["spring", "summer", "autumn", "winter", "wasteland"]:
-        for i in range(16):
-            frames.append(draw_scene(season, i, H=320))
+    parser = argparse.ArgumentParser(description="Generate the seasons walking banner.")
+    parser.add_argument("--output", help="Output file; the format follows the extension (.gif, .png/.apng, .webp). Default: dist/seasons_walking.gif")
+    parser.add_argument("--format", choices=list(BACKENDS), help="Output format, overriding the extension")
+    parser.add_argument("--compare", action="store_true", help="Encode with every backend and report encode time and size")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to draw frames, one season at a time (default: 1)")
+    args = parser.parse_args()
 
     # Save into the repository (works on GitHub Actions and locally)
     repo_root = os.environ.get("GITHUB_WORKSPACE", os.getcwd())
-    out_path = Path(repo_root) / "dist" / "seasons_walking.gif"
+    out_path = Path(args.output) if args.output else Path(repo_root) / "dist" / "seasons_walking.gif"
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    frames[0].save(
-        out_path.as_posix(),
-        save_all=True,
-        append_images=frames[1:],
-        optimize=False,
-        duration=180,
-        loop=0,
-    )
-    print(f"Banner GIF saved → {out_path}")
+
+    if args.compare:
+        print_report(compare_backends(all_frames(args.workers), 180, (out_path.parent / out_path.stem).as_posix()))
+    else:
+        # Each frame goes to an encoder process as soon as it is drawn, so
+        # drawing the next one overlaps with encoding the last
+        with open_writer(out_path.as_posix(), loop=0, backend=args.format, pipeline=True) as writer:
+            for frame in all_frames(args.workers):
+                writer.add(frame, 180)
+        print(f"Banner saved → {out_path}")
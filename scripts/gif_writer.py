@@ -0,0 +1,222 @@
+import io
+import os
+import struct
+from PIL import Image, ImageChops
+
+
+def _palette_bytes(img):
+    palette = img.getpalette() or []
+    return bytes(palette)
+
+
+def _encode_frame(img):
+    """
+    Encodes a single "P" image with Pillow and returns (color_table, image_block),
+    where image_block is the raw image descriptor plus LZW data.
+    """
+    buf = io.BytesIO()
+    img.save(buf, format="GIF", optimize=False, interlace=False)
+    data = buf.getvalue()
+
+    packed = data[10]
+    pos = 13
+    color_table = b""
+    if packed & 0x80:
+        size = 3 << ((packed & 0x07) + 1)
+        color_table = data[pos:pos + size]
+        pos += size
+
+    # Skip any extension blocks Pillow wrote before the image
+    while data[pos] == 0x21:
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+
+    start = pos
+    pos += 10
+    if data[start + 9] & 0x80:
+        pos += 3 << ((data[start + 9] & 0x07) + 1)
+    pos += 1  # LZW minimum code size
+    while data[pos]:
+        pos += data[pos] + 1
+    pos += 1
+    return color_table, data[start:pos]
+
+
+def _encoded_size(img):
+    return sum(map(len, _encode_frame(img)))
+
+
+def _rows(img):
+    """Every eighth row of `img`, enough to rank two encodings of it."""
+    width, height = img.size
+    return img.resize((width, max(1, height // 8)), Image.Resampling.NEAREST)
+
+
+def _table_bits(color_table):
+    return max(0, (len(color_table) // 3).bit_length() - 2)
+
+
+def _punch(region, diff, trans):
+    """
+    Copy of "P" `region` with index `trans` wherever the index difference
+    `diff` is zero.
+    """
+    # Index differences, not colors: read them without the palette
+    unchanged = Image.frombytes("L", diff.size, diff.tobytes()).point(_UNCHANGED)
+    holes = region.copy()
+    holes.paste(trans, mask=unchanged)
+    return holes
+
+
+# Point table turning zero differences into 255 and everything else into 0
+_UNCHANGED = [255] + [0] * 255
+
+
+class GifWriter:
+    """
+    Incremental animated GIF writer: frames are diffed, encoded and written
+    as they are added, so only the previous frame and one pending block are
+    kept in memory however long the animation is.
+
+    Each frame after the first is cropped to the bounding box of pixels that
+    differ from the previous frame and left in place (disposal 1) so the
+    viewer keeps drawing over the previous one. Frames identical to the
+    previous one are dropped and their duration is added to it, which is why
+    the latest block is only written once the next distinct frame (or close())
+    arrives.
+
+    "P" frames sharing the first frame's palette are diffed by index and
+    written against a single global color table, with unchanged pixels set to
+    a spare transparent index when that encodes smaller. Anything else is
+    compared in RGB and each changed region is fast-octree quantized, as
+    Pillow's own GIF encoder does, into its own opaque local color table.
+
+    Usable as a context manager; the file is created on the first add().
+    """
+
+    def __init__(self, path, loop=0):
+        self.path = path
+        self.loop = loop
+        self.frame_count = 0
+        self._fp = None
+        self._size = None
+        self._source_palette = None
+        self._global_palette = None
+        self._previous = None
+        # [bbox, region, transparent index, duration, uses global palette]
+        self._pending = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._fp is not None:
+            self._fp.close()
+
+    def add(self, frame, duration):
+        if self._previous is None:
+            self._start(frame)
+        self.frame_count += 1
+
+        shared = self._global_palette is not None and frame.mode == "P" and _palette_bytes(frame) == self._source_palette
+        current = frame if shared else frame.convert("RGB")
+        previous = self._previous
+        if previous is not None and previous.mode != current.mode:
+            previous = previous.convert("RGB")
+            current = frame.convert("RGB")
+            shared = False
+
+        if previous is None:
+            bbox = (0, 0) + self._size
+        else:
+            diff = ImageChops.subtract_modulo(current, previous)
+            bbox = diff.getbbox()
+            if bbox is None:
+                self._pending[3] += duration
+                return
+        self._previous = current
+
+        region = current.crop(bbox)
+        trans = None
+        if shared:
+            region.putpalette(self._global_palette)
+            # Unchanged pixels usually compress better as the transparent
+            # index, but in busy frames the holes they punch into runs of color
+            # can cost more than they save, so keep whichever version of a
+            # sample of rows encodes smaller
+            if previous is not None:
+                diff = diff.crop(bbox)
+                spare = len(self._source_palette) // 3
+                if _encoded_size(_punch(_rows(region), _rows(diff), spare)) < _encoded_size(_rows(region)):
+                    region = _punch(region, diff, spare)
+                    trans = spare
+        else:
+            # Quantized and kept opaque like Pillow's own GIF encoder does: on
+            # regions this large, trying transparency costs more time than the
+            # few percent of bytes it saves
+            region = region.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+            # The palette comes back padded to 256 entries; cutting it after the
+            # last index in use shrinks the color table and the bits per pixel
+            used = region.getextrema()[1] + 1
+            region.putpalette(region.getpalette()[:3 * used])
+
+        self._flush()
+        self._pending = [bbox, region, trans, duration, shared]
+
+    def close(self):
+        if self._fp is None:
+            raise ValueError("No frames to write")
+        if self._fp.closed:
+            return
+        self._flush()
+        self._fp.write(b"\x3B")
+        self._fp.close()
+
+    def _start(self, frame):
+        self._size = frame.size
+        if frame.mode == "P":
+            self._source_palette = _palette_bytes(frame)
+            if len(self._source_palette) // 3 < 256:
+                # Spare slot after the theme colors doubles as the transparent index
+                self._global_palette = self._source_palette + b"\0\0\0"
+
+        output_dir = os.path.dirname(self.path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self._fp = open(self.path, "wb")
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        bbox, region, trans, duration, shared = self._pending
+        self._pending = None
+        color_table, block = _encode_frame(region)
+        fp = self._fp
+
+        if fp.tell() == 0:
+            width, height = self._size
+            fp.write(b"GIF89a")
+            if shared:
+                fp.write(struct.pack("<HHBBB", width, height, 0xF0 | _table_bits(color_table), 0, 0))
+                fp.write(color_table)
+            else:
+                fp.write(struct.pack("<HHBBB", width, height, 0x70, 0, 0))
+            fp.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", self.loop) + b"\x00")
+
+        flags = 1 << 2  # disposal 1: leave the frame in place
+        if trans is not None:
+            flags |= 1
+        fp.write(struct.pack("<BBBBHBB", 0x21, 0xF9, 4, flags, duration // 10, trans or 0, 0))
+
+        descriptor = bytearray(block[:10])
+        struct.pack_into("<HH", descriptor, 1, bbox[0], bbox[1])
+        if not shared:
+            descriptor[9] = (descriptor[9] & 0x40) | 0x80 | _table_bits(color_table)
+        fp.write(descriptor)
+        if not shared:
+            fp.write(color_table)
+        fp.write(block[10:])
@@ -1,21 +1,138 @@
 import argparse
+import json
+import os
 import requests
 import sys
 import random
-from PIL import Image, ImageDraw, ImageFont
+import time
+from collections import deque
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 from datetime import datetime, timedelta
-from typing import List, Tuple, Dict, TypedDict, Optional, Any
+from typing import List, Tuple, Dict, TypedDict, Optional, Any, Iterator
 
+try:
+    import numpy as np
+except ImportError:  # Only needed for --raster numpy
+    np = None
 
+# Shared animation helpers live next to the other generators in scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from animation_writer import EXTENSIONS, compare_backends, print_report, write_animation
+
+
+# On-disk cache of API responses, one JSON file per (username, year)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'tetris-contributions')
+# A past year is final once we've fetched it this long after it ended
+PAST_YEAR_GRACE = timedelta(days=7)
+REQUEST_TIMEOUT = 10
+REQUEST_RETRIES = 3
+
+def parse_contributions(body: Dict[str, Any]) -> List[Tuple[str, int]]:
+    return [(contribution['date'], contribution['count']) for contribution in body['contributions']]
+
+def load_fixture(path: str) -> List[Tuple[str, int]]:
+    # A saved API response body: {"contributions": [{"date": ..., "count": ...}, ...]}
+    with open(path) as f:
+        return parse_contributions(json.load(f))
+
+def _cache_path(cache_dir: str, username: str, year: int) -> str:
+    return os.path.join(cache_dir, f"{username.lower()}-{year}.json")
+
+def _read_cache(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache(path: str, entry: Dict[str, Any]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, path)
+
+def _is_final(year: int, fetched_at: float) -> bool:
+    # Contributions for a finished year no longer change, so once fetched a
+    # week into the next year the cached copy is kept for good
+    return datetime.fromtimestamp(fetched_at) >= datetime(year + 1, 1, 1) + PAST_YEAR_GRACE
+
+def get_github_contributions(username: str, year: int, cache_dir: Optional[str] = CACHE_DIR, offline: bool = False, session: Optional[requests.Session] = None) -> List[Tuple[str, int]]:
+    cache_path = _cache_path(cache_dir, username, year) if cache_dir else None
+    cached = _read_cache(cache_path) if cache_path else None
+
+    if offline:
+        if cached is None:
+            raise Exception(f"No cached contributions for {username} ({year}) in offline mode")
+        return parse_contributions(cached['body'])
+
+    if cached is not None and _is_final(year, cached['fetched_at']):
+        return parse_contributions(cached['body'])
+
+    # Revalidate anything else; an unchanged year costs a 304 with no body
+    headers = {}
+    if cached is not None:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
 
-def get_github_contributions(username: str, year: int) -> List[Tuple[str, int]]:
     url = f'https://github-contributions-api.jogruber.de/v4/{username}?y={year}'
-    response = requests.get(url)
+    http = session or requests
+    for attempt in range(REQUEST_RETRIES):
+        try:
+            response = http.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            if attempt == REQUEST_RETRIES - 1:
+                if cached is not None:
+                    print(f"Warning: network error, using cached contributions for {username} ({year})")
+                    return parse_contributions(cached['body'])
+                raise
+        else:
+            if response.status_code < 500 or attempt == REQUEST_RETRIES - 1:
+                break
+        time.sleep(2 ** attempt)
+
+    if response.status_code == 304 and cached is not None:
+        cached['fetched_at'] = time.time()
+        _write_cache(cache_path, cached)
+        return parse_contributions(cached['body'])
+    if response.status_code >= 500 and cached is not None:
+        print(f"Warning: server error {response.status_code}, using cached contributions for {username} ({year})")
+        return parse_contributions(cached['body'])
     if response.status_code != 200:
         raise Exception(f"Failed to fetch data from GitHub: {response.status_code}")
 
     body = response.json()
-    return [(contribution['date'], contribution['count']) for contribution in body['contributions']]
+    if cache_path:
+        _write_cache(cache_path, {
+            'fetched_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': body,
+        })
+    return parse_contributions(body)
+
+# Theme Configuration
+class Theme(TypedDict):
+    background: str
+    text: Tuple[int, int, int]
+    colors: List[str]
+
+THEMES: Dict[str, Theme] = {
+    'light': {
+        'background': '#ffffff',
+        'text': (36, 41, 47),
+        'colors': ['#ebedf0', '#c6e48b', '#7bc96f', '#239a3b', '#196127', '#103d19']
+    },
+    'dark': {
+        'background': '#0d1117',
+        'text': (201, 209, 217), # GitHub Dark Text
+        'colors': ['#161b22', '#0e4429', '#006d32', '#26a641', '#39d353', '#72ff88']
+    }
+}
 
 _FONT_CACHE = {}
 
@@ -39,13 +156,63 @@ def get_font(size):
     _FONT_CACHE[size] = ImageFont.load_default()
     return _FONT_CACHE[size]
 
-def draw_grid(draw, grid, cell_size, colors, theme_colors):
-    for week in range(len(grid)):
-        for day in range(len(grid[0])):
-            color = colors[grid[week][day]]
-            x0, y0 = week * cell_size + 80 + 2, day * cell_size + 40 + 2
-            x1, y1 = x0 + cell_size - 4, y0 + cell_size - 4
-            draw.rounded_rectangle([x0, y0, x1, y1], radius=10, fill=color)
+# Frames are rendered straight into palette ("P") mode. Indices 0..TEXT_RAMP-1
+# blend the background (0) into the text colour (TEXT_RAMP-1) for anti-aliased
+# legend text, followed by the six level colours and the falling-piece outline.
+TEXT_RAMP = 64
+LEVEL_INDEX = TEXT_RAMP
+OUTLINE_INDEX = LEVEL_INDEX + 6
+
+def theme_palette(theme_colors: Dict[str, Any]) -> List[int]:
+    bg = ImageColor.getrgb(theme_colors['background'])
+    fg = ImageColor.getrgb(theme_colors['text']) if isinstance(theme_colors['text'], str) else theme_colors['text']
+    palette: List[int] = []
+    for i in range(TEXT_RAMP):
+        a = i / (TEXT_RAMP - 1)
+        palette.extend(round(b + (f - b) * a) for b, f in zip(bg, fg))
+    for color in theme_colors['colors']:
+        palette.extend(ImageColor.getrgb(color))
+    palette.extend((255, 255, 255))
+    return palette
+
+def new_frame(size: Tuple[int, int], theme_colors: Dict[str, Any]) -> Image.Image:
+    img = Image.new('P', size, 0)
+    img.putpalette(theme_palette(theme_colors))
+    return img
+
+_TILE_CACHE = {}
+
+def get_cell_tile(theme: str, theme_colors: Dict[str, Any], level: int, landed: bool, cell_size: int, height: Optional[int] = None) -> Tuple[Image.Image, Image.Image]:
+    # Pre-rasterized rounded cell plus its shape mask, so frames are built with
+    # Image.paste instead of running rounded_rectangle for every cell.
+    # Falling cells clipped at the header get their own (shorter) tile.
+    width = cell_size - 3
+    if height is None:
+        height = width
+    key = (theme, cell_size, level, landed, height)
+    if key in _TILE_CACHE:
+        return _TILE_CACHE[key]
+
+    box = [0, 0, width - 1, height - 1]
+    tile = new_frame((width, height), theme_colors)
+    mask = Image.new('L', (width, height), 0)
+    if landed:
+        ImageDraw.Draw(tile).rounded_rectangle(box, radius=10, fill=LEVEL_INDEX + level)
+        ImageDraw.Draw(mask).rounded_rectangle(box, radius=10, fill=255)
+    else:
+        ImageDraw.Draw(tile).rounded_rectangle(box, radius=8, fill=LEVEL_INDEX + level, outline=OUTLINE_INDEX)
+        ImageDraw.Draw(mask).rounded_rectangle(box, radius=8, fill=255, outline=255)
+    _TILE_CACHE[key] = (tile, mask)
+    return _TILE_CACHE[key]
+
+def draw_cell(img, week, day, cell_size, tile):
+    x0, y0 = week * cell_size + 80 + 2, day * cell_size + 40 + 2
+    img.paste(tile[0], (x0, y0), tile[1])
+
+def draw_grid(img, levels, height, cell_size, theme, theme_colors):
+    # `levels` is a flat board, one byte per cell at week * height + day
+    for i, level in enumerate(levels):
+        draw_cell(img, i // height, i % height, cell_size, get_cell_tile(theme, theme_colors, level, True, cell_size))
 
 def draw_legend(draw: ImageDraw.Draw, cell_size: int, image_width: int, image_height: int, username: str, year: str, theme_colors: Dict[str, Any], month_labels: List[Tuple[int, str]]):
     # Draw day names (Only show Mon, Wed, Fri)
@@ -62,9 +229,423 @@ def draw_legend(draw: ImageDraw.Draw, cell_size: int, image_width: int, image_he
 
     # Removed year text as requested to prevent overlap
 
+def render_base_layer(image_width: int, image_height: int, cell_size: int, username: str, year: str, theme_colors: Dict[str, Any], month_labels: List[Tuple[int, str]]) -> Image.Image:
+    # Background and legend never change between frames, so rasterize them once
+    # and let every frame start from a copy of this layer.
+    # Text coverage is drawn as an 8-bit mask and mapped onto the text ramp of
+    # the theme palette, since anti-aliased text can't be drawn in "P" mode.
+    coverage = Image.new('L', (image_width, image_height), 0)
+    draw_legend(ImageDraw.Draw(coverage), cell_size, image_width, image_height, username, year, dict(theme_colors, text=255), month_labels)
+    base = coverage.point([round(a * (TEXT_RAMP - 1) / 255) for a in range(256)])
+    base.putpalette(theme_palette(theme_colors))
+    return base
+
+def build_fixed_shapes() -> List[Tuple[Tuple[int, int], ...]]:
+    # Every tetromino orientation plus the smaller filler pieces, anchored on
+    # their left-most, bottom-most cell. Order decides which shape wins a fit.
+    shapes = [
+        [(0,0), (1,0), (2,0), (3,0)], [(0,0), (0,1), (0,2), (0,3)], [(0,0), (1,0), (0,1), (1,1)],
+        [(0,0), (0,1), (0,2), (1,2)], [(0,0), (1,0), (2,0), (0,1)], [(0,0), (1,0), (1,1), (1,2)], [(2,0), (0,1), (1,1), (2,1)],
+        [(1,0), (1,1), (1,2), (0,2)], [(0,0), (0,1), (1,1), (2,1)], [(0,0), (1,0), (0,1), (0,2)], [(0,0), (1,0), (2,0), (2,1)],
+        [(0,0), (1,0), (2,0), (1,1)], [(1,0), (0,1), (1,1), (1,2)], [(1,0), (0,1), (1,1), (2,1)], [(0,0), (0,1), (0,2), (1,1)],
+        [(1,0), (2,0), (0,1), (1,1)], [(0,0), (0,1), (1,1), (1,2)], [(0,0), (1,0), (1,1), (2,1)], [(1,0), (1,1), (0,1), (0,2)]
+    ]
+    normalized_shapes = []
+    for s in shapes:
+        ax = min(p[0] for p in s)
+        ay = max(p[1] for p in s if p[0] == ax)
+        normalized_shapes.append([(p[0]-ax, p[1]-ay) for p in s])
+    normalized_shapes.extend([
+        [(0,0), (1,0), (2,0)], [(0,0), (0,-1), (0,-2)], [(0,0), (1,0), (0,-1)], [(0,0), (1,0), (1,-1)], [(0,0), (0,-1), (1,-1)], [(0,0), (0,-1), (-1,-1)],
+        [(0,0), (1,0)], [(0,0), (0,-1)], [(0,0)]
+    ])
+    fixed_shapes = []
+    for norm in normalized_shapes:
+        ax = min(p[0] for p in norm)
+        ay = max(p[1] for p in norm if p[0] == ax)
+        fixed = tuple(sorted([(p[0]-ax, p[1]-ay) for p in norm]))
+        if fixed not in fixed_shapes:
+            fixed_shapes.append(fixed)
+    return fixed_shapes
+
+FIXED_SHAPES = build_fixed_shapes()
+
+class Pieces:
+    # Packed pieces as a structure of arrays instead of one dict per piece.
+    # Piece i owns cells first[i]:first[i + 1] of cell_x / cell_y / cell_level;
+    # the per-piece arrays hold everything the fall simulation needs.
+    __slots__ = ('first', 'cell_x', 'cell_y', 'cell_level', 'max_y', 'start_frame', 'landing')
+
+    def __init__(self):
+        self.first = array('i', [0])
+        self.cell_x = array('i')
+        self.cell_y = array('b')
+        self.cell_level = array('B')
+        self.max_y = array('b')
+        self.start_frame = array('i')
+        self.landing = array('i')
+
+    def __len__(self) -> int:
+        return len(self.start_frame)
+
+    def append(self, cells: List[Tuple[int, int, int]], start_frame: int):
+        for x, y, level in cells:
+            self.cell_x.append(x)
+            self.cell_y.append(y)
+            self.cell_level.append(level)
+        self.first.append(len(self.cell_x))
+        max_y = max(y for x, y, level in cells)
+        self.max_y.append(max_y)
+        self.start_frame.append(start_frame)
+        # It reaches offset 0 at start_frame + max_y and joins the board a frame later
+        self.landing.append(start_frame + max_y + 1)
+
+    def cells(self, i: int) -> range:
+        # Indices into the cell arrays for piece i
+        return range(self.first[i], self.first[i + 1])
+
+def pack_pieces(levels: bytearray, falls: bytearray, width: int, height: int, first_week_with_data: int) -> Pieces:
+    # Occupancy is kept as bitmasks: bit y of a column is set once (x, y) is
+    # taken. No shape spans more than `span` columns, so the columns from x
+    # onwards fit in one small integer `window` (bit dx * height + y) and every
+    # shape has a precomputed mask for each legal anchor row. A fit test is a
+    # width check plus a single AND.
+    # `levels` and `falls` are flat boards (cell at x * height + y); only
+    # cells flagged in `falls` are free to be covered by pieces.
+    columns = [0] * width
+    for i, fall in enumerate(falls):
+        if not fall:
+            columns[i // height] |= 1 << (i % height)
+
+    span = max(dx for shape in FIXED_SHAPES for dx, dy in shape) + 1
+    anchors: List[List[Tuple[int, int, Tuple[Tuple[int, int], ...]]]] = [[] for _ in range(height)]
+    for shape in FIXED_SHAPES:
+        max_dx = max(dx for dx, dy in shape)
+        min_dy = min(dy for dx, dy in shape)
+        max_dy = max(dy for dx, dy in shape)
+        for y in range(max(0, -min_dy), height - max(0, max_dy)):
+            mask = 0
+            for dx, dy in shape:
+                mask |= 1 << (dx * height + y + dy)
+            anchors[y].append((mask, max_dx, shape))
+
+    window = 0
+    for dx in range(min(span, width)):
+        window |= columns[dx] << (dx * height)
+
+    final_pieces = Pieces()
+    for x in range(width):
+        # We process from bottom-up (Saturday to Sunday) to prioritize pieces at the bottom
+        for y in range(height-1, -1, -1):
+            if window >> y & 1: continue
+            
+            for mask, max_dx, shape in anchors[y]:
+                if x + max_dx < width and not window & mask:
+                    window |= mask
+                    shape_cells = [(x+dx, y+dy, levels[(x+dx) * height + y+dy]) for dx, dy in shape]
+                    final_pieces.append(shape_cells, max(0, (x - first_week_with_data)) * 4) # Optimized cascade
+                    break
+
+        # Slide the window one column to the right
+        window >>= height
+        if x + span < width:
+            window |= columns[x + span] << ((span - 1) * height)
+    return final_pieces
+
+def piece_offset(pieces: Pieces, i: int, frame: int) -> int:
+    # A piece starts completely above the board at -(max_y + 1) and drops one
+    # row per frame from start_frame, so its offset after frame `frame` is
+    # known without stepping through the frames before it
+    return min(0, frame - pieces.start_frame[i] - pieces.max_y[i])
+
+def frame_state(pieces: Pieces, frame: int) -> Tuple[List[int], List[Tuple[int, int]]]:
+    # Board state at any frame index: (indices of pieces already on the board,
+    # [(piece index, y offset) still in the air]). Needs no earlier frames, so
+    # a single frame can be rendered on its own or frames in any order.
+    landed = [i for i, landing in enumerate(pieces.landing) if landing <= frame]
+    falling = [(i, piece_offset(pieces, i, frame)) for i, start in enumerate(pieces.start_frame) if start <= frame and piece_offset(pieces, i, frame) < 0]
+    return landed, falling
+
+def frame_schedule(pieces: Pieces, max_frames: int, frame_duration: int = 100, final_hold: int = 10000) -> Tuple[List[int], List[int]]:
+    # Which frame indices end up in the animation and how long each is shown.
+    # A frame only differs from the one before it while some piece is between
+    # its start_frame and its landing frame; all other frames are folded into
+    # the previous entry's duration. The animation ends on the frame the last
+    # piece lands (plus a 10-second hold), or at max_frames.
+    last_landing = max(pieces.landing, default=max_frames)
+    end = last_landing + 1 if last_landing < max_frames else max_frames
+
+    changed = {0}
+    for start, landing in zip(pieces.start_frame, pieces.landing):
+        changed.update(range(start, min(landing + 1, end)))
+    frames = sorted(f for f in changed if f < end)
+
+    durations = [(nxt - f) * frame_duration for f, nxt in zip(frames, frames[1:] + [end])]
+    if len(pieces) and last_landing < max_frames:
+        # Hold the COMPLETE final image for a 10-second static pause
+        durations[-1] += final_hold
+    return frames, durations
+
+def simulate_fall(pieces: Pieces, max_frames: int, frame_duration: int = 100, final_hold: int = 10000) -> Tuple[List[Tuple[List[int], List[Tuple[int, int]]]], List[int]]:
+    # Sequential version of frame_state() over the frames in frame_schedule().
+    # Each step is (indices of pieces that landed this frame, [(piece index,
+    # y offset) still in the air]), which lets a renderer keep one settled
+    # board and only add the pieces that just landed.
+    #
+    # Only pieces in the air are visited each frame: waiting pieces sit in a
+    # queue ordered by start_frame and are activated when their frame comes,
+    # and landed pieces are retired. pack_pieces() emits pieces with
+    # non-decreasing start_frame, so activation order matches drawing order.
+    frames, durations = frame_schedule(pieces, max_frames, frame_duration, final_hold)
+    steps: List[Tuple[List[int], List[Tuple[int, int]]]] = []
+
+    queue = sorted(range(len(pieces)), key=lambda i: pieces.start_frame[i])
+    next_piece = 0
+    active: List[int] = []
+    for frame in frames:
+        while next_piece < len(queue) and pieces.start_frame[queue[next_piece]] <= frame:
+            active.append(queue[next_piece])
+            next_piece += 1
+
+        # Every landing frame is in the schedule, so nothing lands unseen
+        landed = [i for i in active if pieces.landing[i] == frame]
+        active = [i for i in active if pieces.landing[i] > frame]
+        falling = [(i, piece_offset(pieces, i, frame)) for i in active if piece_offset(pieces, i, frame) < 0]
+        steps.append((landed, falling))
+
+    return steps, durations
+
+def draw_landed(board: Image.Image, pieces: Pieces, landed: List[int], cell_size: int, theme: str, theme_colors: Dict[str, Any]):
+    for i in landed:
+        for c in pieces.cells(i):
+            draw_cell(board, pieces.cell_x[c], pieces.cell_y[c], cell_size, get_cell_tile(theme, theme_colors, pieces.cell_level[c], True, cell_size))
+
+def draw_falling(img: Image.Image, pieces: Pieces, falling: List[Tuple[int, int]], cell_size: int, legend_width: int, theme: str, theme_colors: Dict[str, Any]):
+    for i, offset in falling:
+        for c in pieces.cells(i):
+            x0 = pieces.cell_x[c] * cell_size + legend_width + 2
+            y0 = (pieces.cell_y[c] + offset) * cell_size + 40 + 2
+            # Define clip box to only show pieces within the grid vertically
+            y1 = y0 + cell_size - 4
+            if y1 > 40: # Only draw if part of the cell is below the header
+                top = max(40, y0)
+                tile, mask = get_cell_tile(theme, theme_colors, pieces.cell_level[c], False, cell_size, y1 - top + 1)
+                img.paste(tile, (x0, top), mask)
+
+def render_frames(pieces: Pieces, steps, board: Image.Image, cell_size: int, legend_width: int, theme: str, theme_colors: Dict[str, Any]) -> Iterator[Image.Image]:
+    # Rasterizes a simulated schedule for one theme, yielding frames one at a
+    # time so they can be encoded as they are produced. `board` is the
+    # settled board (base layer plus every cell that never falls) and is
+    # updated in place as pieces land, so each frame is a copy of it plus the
+    # pieces still in the air.
+    for landed, falling in steps:
+        draw_landed(board, pieces, landed, cell_size, theme, theme_colors)
+        img = board.copy()
+        # Draw falling pieces (still in the air)
+        draw_falling(img, pieces, falling, cell_size, legend_width, theme, theme_colors)
+        yield img
+
+# NumPy raster backend (--raster numpy). Frames are uint8 arrays of palette
+# indices; tiles are the same pre-rasterized ones the PIL path pastes, so the
+# output is pixel-identical, but a whole set of cells is stamped with one
+# vectorized assignment instead of one paste per cell.
+def get_tile_arrays(theme: str, theme_colors: Dict[str, Any], landed: bool, cell_size: int, height: Optional[int] = None):
+    # (tiles, masks) for all six levels, stacked so they can be indexed by level
+    key = ('numpy', theme, cell_size, landed, height)
+    if key not in _TILE_CACHE:
+        tiles = [get_cell_tile(theme, theme_colors, level, landed, cell_size, height) for level in range(6)]
+        _TILE_CACHE[key] = (np.stack([np.asarray(tile) for tile, mask in tiles]), np.stack([np.asarray(mask) > 0 for tile, mask in tiles]))
+    return _TILE_CACHE[key]
+
+def stamp_cells(arr, xs, ys, levels, tiles, masks, cell_size: int):
+    # Same placement as draw_cell() for every (xs[k], ys[k]) at once. Cells
+    # never overlap, so the order they are written in doesn't matter.
+    th, tw = tiles.shape[1:]
+    rows = (ys * cell_size + 40 + 2)[:, None, None] + np.arange(th)[None, :, None]
+    cols = (xs * cell_size + 80 + 2)[:, None, None] + np.arange(tw)[None, None, :]
+    arr[rows, cols] = np.where(masks[levels], tiles[levels], arr[rows, cols])
+
+def draw_grid_numpy(arr, levels: bytearray, height: int, cell_size: int, theme: str, theme_colors: Dict[str, Any]):
+    cells = np.arange(len(levels))
+    tiles, masks = get_tile_arrays(theme, theme_colors, True, cell_size)
+    stamp_cells(arr, cells // height, cells % height, np.frombuffer(levels, dtype=np.uint8), tiles, masks, cell_size)
+
+def draw_falling_numpy(arr, pieces: Pieces, falling: List[Tuple[int, int]], cell_size: int, legend_width: int, theme: str, theme_colors: Dict[str, Any]):
+    # Falling pieces can overlap each other above the board, so they are
+    # stamped one cell at a time in the same order as draw_falling()
+    for i, offset in falling:
+        for c in pieces.cells(i):
+            x0 = pieces.cell_x[c] * cell_size + legend_width + 2
+            y0 = (pieces.cell_y[c] + offset) * cell_size + 40 + 2
+            y1 = y0 + cell_size - 4
+            if y1 > 40:
+                top = max(40, y0)
+                tiles, masks = get_tile_arrays(theme, theme_colors, False, cell_size, y1 - top + 1)
+                level = pieces.cell_level[c]
+                np.copyto(arr[top:y1 + 1, x0:x0 + tiles.shape[2]], tiles[level], where=masks[level])
+
+def frame_from_array(arr, palette: List[int]) -> Image.Image:
+    # Wraps a frame array as a "P" image sharing its memory (no copy)
+    img = Image.frombuffer("P", (arr.shape[1], arr.shape[0]), arr, "raw", "P", 0, 1)
+    img.putpalette(palette)
+    return img
+
+def render_frames_numpy(pieces: Pieces, steps, board, palette: List[int], cell_size: int, legend_width: int, theme: str, theme_colors: Dict[str, Any]) -> Iterator[Image.Image]:
+    # render_frames() on a NumPy `board` (settled board as palette indices,
+    # left untouched)
+    settled = np.array(board)
+    cell_x, cell_y, cell_level = np.asarray(pieces.cell_x, dtype=np.intp), np.asarray(pieces.cell_y, dtype=np.intp), np.asarray(pieces.cell_level)
+    tiles, masks = get_tile_arrays(theme, theme_colors, True, cell_size)
+    for landed, falling in steps:
+        if landed:
+            cells = [c for i in landed for c in pieces.cells(i)]
+            stamp_cells(settled, cell_x[cells], cell_y[cells], cell_level[cells], tiles, masks, cell_size)
+        arr = settled.copy()
+        draw_falling_numpy(arr, pieces, falling, cell_size, legend_width, theme, theme_colors)
+        yield frame_from_array(arr, palette)
+
+def _render_shard(pieces: Pieces, frames: List[int], board_bytes: bytes, size: Tuple[int, int], cell_size: int, legend_width: int, theme: str, raster: str) -> List[bytes]:
+    # Process-pool worker for render_frames_parallel(). Starts from the state
+    # at its first frame index and carries the settled board forward through
+    # the rest of its (contiguous) shard, returning each frame as raw palette
+    # indices; the parent already has the palette.
+    theme_colors = THEMES.get(theme, THEMES['light'])
+    steps = []
+    previous = -1
+    for frame in frames:
+        steps.append(([i for i, landing in enumerate(pieces.landing) if previous < landing <= frame], frame_state(pieces, frame)[1]))
+        previous = frame
+
+    if raster == 'numpy':
+        board = np.frombuffer(board_bytes, dtype=np.uint8).reshape(size[1], size[0])
+        images = render_frames_numpy(pieces, steps, board, theme_palette(theme_colors), cell_size, legend_width, theme, theme_colors)
+    else:
+        board = Image.frombytes("P", size, board_bytes)
+        board.putpalette(theme_palette(theme_colors))
+        images = render_frames(pieces, steps, board, cell_size, legend_width, theme, theme_colors)
+    return [img.tobytes() for img in images]
+
+# Frames per shard handed to a worker in render_frames_parallel()
+SHARD_FRAMES = 16
+
+def render_frames_parallel(pieces: Pieces, frames: List[int], board: Image.Image, cell_size: int, legend_width: int, theme: str, workers: int, raster: str = 'pil') -> Iterator[Image.Image]:
+    # Same frames as render_frames(), rasterized in `workers` processes. The
+    # scheduled frame indices are split into contiguous shards of
+    # SHARD_FRAMES and yielded back in order. At most two shards per worker
+    # are in flight, so finished frames waiting for the encoder stay bounded.
+    shards = [frames[i:i + SHARD_FRAMES] for i in range(0, len(frames), SHARD_FRAMES)]
+    board_bytes = board.tobytes()
+    palette = board.getpalette()
 
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for shard in shards:
+            pending.append(pool.submit(_render_shard, pieces, shard, board_bytes, board.size, cell_size, legend_width, theme, raster))
+            if len(pending) < 2 * workers:
+                continue
+            yield from _shard_frames(pending.popleft().result(), board.size, palette)
+        while pending:
+            yield from _shard_frames(pending.popleft().result(), board.size, palette)
 
-def create_tetris_gif(username: str, year: int, contributions: List[Tuple[Optional[str], int]], output_path: str, theme: str, year_range: str):
+def _shard_frames(shard: List[bytes], size: Tuple[int, int], palette: List[int]) -> Iterator[Image.Image]:
+    for data in shard:
+        img = Image.frombytes("P", size, data)
+        img.putpalette(palette)
+        yield img
+
+def write_svg(path: str, pieces: Pieces, settled: bytearray, height: int, image_size: Tuple[int, int], cell_size: int, legend_width: int, month_labels: List[Tuple[int, str]], theme_colors: Dict[str, Any], total_ms: int, frame_duration: int = 100):
+    # Vector version of the animation: the legend and settled grid are drawn
+    # once, and every piece gets SMIL animations on the same looping timeline
+    # as the GIF (total_ms, the sum of its frame durations). A piece is shown
+    # falling with the outlined style from start_frame, slides down max_y rows
+    # and is swapped for its landed cells when it reaches the board.
+    image_width, image_height = image_size
+    colors = theme_colors['colors']
+    text = theme_colors['text'] if isinstance(theme_colors['text'], str) else '#%02x%02x%02x' % tuple(theme_colors['text'])
+    tile = cell_size - 3
+    ascent = get_font(16).getmetrics()[0]
+    seconds = total_ms / 1000
+
+    def rect(x, y, level, landed):
+        # Cells reference one shared tile per level and style (see <defs>)
+        return f'<use href="#{"c" if landed else "f"}{level}" x="{x}" y="{y}"/>'
+
+    def animate(attribute, values, key_times, mode):
+        times = ';'.join(f'{t / total_ms:.5f}' for t in key_times)
+        return f'<animate attributeName="{attribute}" values="{values}" keyTimes="{times}" dur="{seconds}s" calcMode="{mode}" repeatCount="indefinite"/>'
+
+    out = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{image_width}" height="{image_height}" viewBox="0 0 {image_width} {image_height}">',
+        '<defs>',
+        *(f'<rect id="c{level}" width="{tile}" height="{tile}" rx="10" fill="{color}"/>' for level, color in enumerate(colors)),
+        *(f'<rect id="f{level}" x="0.5" y="0.5" width="{tile - 1}" height="{tile - 1}" rx="8" fill="{color}" stroke="#ffffff"/>' for level, color in enumerate(colors)),
+        f'<clipPath id="board"><rect x="0" y="40" width="{image_width}" height="{image_height - 40}"/></clipPath>',
+        '</defs>',
+        f'<rect width="100%" height="100%" fill="{theme_colors["background"]}"/>',
+        f'<g font-family="DejaVu Sans, Liberation Sans, Arial, sans-serif" font-weight="bold" font-size="16" fill="{text}">',
+    ]
+    # Same labels and positions as draw_legend(); PIL places text by its top, SVG by its baseline
+    for i, day in enumerate(["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]):
+        if day in ["Mon", "Wed", "Fri"]:
+            out.append(f'<text x="10" y="{i * cell_size + 40 + 10 + ascent}">{day}</text>')
+    for x, month_name in month_labels:
+        out.append(f'<text x="{x}" y="{10 + ascent}">{month_name}</text>')
+    out.append('</g>')
+
+    for i, level in enumerate(settled):
+        out.append(rect(i // height * cell_size + legend_width + 2, i % height * cell_size + 40 + 2, level, True))
+
+    falling = []
+    for i in range(len(pieces)):
+        start = pieces.start_frame[i] * frame_duration
+        landed = (pieces.start_frame[i] + pieces.max_y[i]) * frame_duration
+        cells = [(pieces.cell_x[c] * cell_size + legend_width + 2, pieces.cell_y[c] * cell_size + 40 + 2, pieces.cell_level[c]) for c in pieces.cells(i)]
+        if landed > start:
+            drop = pieces.max_y[i] * cell_size
+            falling.append('<g visibility="hidden">'
+                           + animate('visibility', 'hidden;visible;hidden', (0, start, landed), 'discrete')
+                           + f'<g><animateTransform attributeName="transform" type="translate" values="0 -{drop};0 -{drop};0 0;0 0" keyTimes="0;{start / total_ms:.5f};{landed / total_ms:.5f};1" dur="{seconds}s" repeatCount="indefinite"/>'
+                           + ''.join(rect(x, y, level, False) for x, y, level in cells) + '</g></g>')
+        out.append('<g visibility="hidden">' + animate('visibility', 'hidden;visible', (0, landed), 'discrete')
+                   + ''.join(rect(x, y, level, True) for x, y, level in cells) + '</g>')
+    # Falling pieces are hidden above the board, like the header clip in draw_falling()
+    out.append('<g clip-path="url(#board)">' + ''.join(falling) + '</g>')
+    out.append('</svg>')
+
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(path, 'w') as f:
+        f.write('\n'.join(out) + '\n')
+
+# --format name -> file extension; all but svg are animation_writer backends
+FORMAT_EXTENSIONS = {'gif': '.gif', 'apng': '.png', 'webp': '.webp', 'webp-lossy': '.webp', 'svg': '.svg'}
+
+def write_still(path: str, img: Image.Image):
+    # PNG keeps the palette image as is; WebP (picked by the extension) is
+    # written lossless so cell colors stay exact
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if path.lower().endswith('.webp'):
+        img.convert('RGB').save(path, lossless=True)
+    else:
+        img.save(path, optimize=True)
+
+def create_tetris_gif(username: str, year: int, contributions: List[Tuple[Optional[str], int]], output_path: str, theme: str, year_range: str, workers: Optional[int] = None, raster: str = 'pil', fmt: str = 'gif'):
+    create_tetris_gifs(username, year, contributions, {theme: output_path}, year_range, workers, raster, fmt)
+
+def create_tetris_gifs(username: str, year: int, contributions: List[Tuple[Optional[str], int]], outputs: Dict[str, str], year_range: str, workers: Optional[int] = None, raster: str = 'pil', fmt: str = 'gif'):
+    # Grid building, piece packing and the fall simulation don't depend on the
+    # theme, so they run once and only rasterization + encoding run per theme
+    # in `outputs` (theme name -> output path). `raster` picks the PIL or
+    # NumPy backend; both produce identical frames. `fmt` is an animation
+    # backend (gif, apng, webp, webp-lossy), 'compare' to encode with all of
+    # them and report time and size, or 'svg' / 'still': with 'svg' nothing is
+    # rasterized and each piece's fall is written as an SVG animation instead,
+    # and 'still' writes only the final board as a PNG or WebP image.
+    if raster == 'numpy' and np is None:
+        raise Exception("--raster numpy requires NumPy (pip install numpy)")
     height = 7  # 7 days per week
     width = (len(contributions) + height - 1) // height
     cell_size = 40
@@ -72,35 +653,14 @@ def create_tetris_gif(username: str, year: int, contributions: List[Tuple[Option
     image_width = width * cell_size + legend_width + 20 # Reduced extra padding
     image_height = height * cell_size + 80 # Reduced vertical padding
 
-    # Theme Configuration
-    class Theme(TypedDict):
-        background: str
-        text: Tuple[int, int, int]
-        colors: List[str]
-
-    THEMES: Dict[str, Theme] = {
-        'light': {
-            'background': '#ffffff',
-            'text': (36, 41, 47),
-            'colors': ['#ebedf0', '#c6e48b', '#7bc96f', '#239a3b', '#196127', '#103d19']
-        },
-        'dark': {
-            'background': '#0d1117',
-            'text': (201, 209, 217), # GitHub Dark Text
-            'colors': ['#161b22', '#0e4429', '#006d32', '#26a641', '#39d353', '#72ff88']
-        }
-    }
-    
-    theme_colors = THEMES.get(theme, THEMES['light'])
-    colors = theme_colors['colors']
-    background_color = theme_colors['background']
+    # Flat boards, one byte per cell at week * height + day: `levels` holds
+    # each cell's color index and `falls` marks the dated, non-empty cells
+    # that drop in as pieces
+    levels = bytearray(width * height)
+    falls = bytearray(width * height)
 
-    frames: List[Image.Image] = []
     # Map counts to color index (0-5)
     # 0 -> 0, 1-10 -> 1, 11-20 -> 2, 21-30 -> 3, 31-40 -> 4, 41+ -> 5
-    grid: List[List[int]] = [[0] * height for _ in range(width)]
-    coord_to_val = {}
-    
     for i, (date, count) in enumerate(contributions):
         week = i // 7
         day = i % 7
@@ -113,9 +673,9 @@ def create_tetris_gif(username: str, year: int, contributions: List[Tuple[Option
         elif count <= 40: val = 4
         else: val = 5
         
-        grid[week][day] = val
-        if date:
-            coord_to_val[(week, day)] = val
+        levels[week * height + day] = val
+        if date and val:
+            falls[week * height + day] = 1
 
     # Debug output removed to keep logs clean
 
@@ -145,203 +705,243 @@ def create_tetris_gif(username: str, year: int, contributions: List[Tuple[Option
             first_week_with_data = min(first_week_with_data, i // 7)
         if i >= len(contributions)-21:
             w, dy = i // 7, i % 7
-            print(f"  {d} -> Grid[{w}][{dy}] = {grid[w][dy]}")
+            print(f"  {d} -> Grid[{w}][{dy}] = {levels[w * height + dy]}")
     
     if first_week_with_data == width: first_week_with_data = 0
     print(f"First week with data: {first_week_with_data}")
 
-    # ... in loops replace draw_legend calls:
-    # draw_legend(draw, cell_size, image_width, image_height, username, year_range, theme_colors, month_labels)
-    
-    # Animate each level batch
-    print(f"Generating GIF for {username} - Theme: {theme}")
-
-    # Animate each group of cells falling like actual pieces
-    print(f"Generating GIF for {username} - Theme: {theme}")
-
-    shapes = [
-        [(0,0), (1,0), (2,0), (3,0)], [(0,0), (0,1), (0,2), (0,3)], [(0,0), (1,0), (0,1), (1,1)],
-        [(0,0), (0,1), (0,2), (1,2)], [(0,0), (1,0), (2,0), (0,1)], [(0,0), (1,0), (1,1), (1,2)], [(2,0), (0,1), (1,1), (2,1)],
-        [(1,0), (1,1), (1,2), (0,2)], [(0,0), (0,1), (1,1), (2,1)], [(0,0), (1,0), (0,1), (0,2)], [(0,0), (1,0), (2,0), (2,1)],
-        [(0,0), (1,0), (2,0), (1,1)], [(1,0), (0,1), (1,1), (1,2)], [(1,0), (0,1), (1,1), (2,1)], [(0,0), (0,1), (0,2), (1,1)],
-        [(1,0), (2,0), (0,1), (1,1)], [(0,0), (0,1), (1,1), (1,2)], [(0,0), (1,0), (1,1), (2,1)], [(1,0), (1,1), (0,1), (0,2)]
-    ]
-    normalized_shapes = []
-    for s in shapes:
-        ax = min(p[0] for p in s)
-        ay = max(p[1] for p in s if p[0] == ax)
-        normalized_shapes.append([(p[0]-ax, p[1]-ay) for p in s])
-    normalized_shapes.extend([
-        [(0,0), (1,0), (2,0)], [(0,0), (0,-1), (0,-2)], [(0,0), (1,0), (0,-1)], [(0,0), (1,0), (1,-1)], [(0,0), (0,-1), (1,-1)], [(0,0), (0,-1), (-1,-1)],
-        [(0,0), (1,0)], [(0,0), (0,-1)], [(0,0)]
-    ])
-    fixed_shapes = []
-    for norm in normalized_shapes:
-        ax = min(p[0] for p in norm)
-        ay = max(p[1] for p in norm if p[0] == ax)
-        fixed = tuple(sorted([(p[0]-ax, p[1]-ay) for p in norm]))
-        if fixed not in fixed_shapes:
-            fixed_shapes.append(fixed)
+    if fmt == 'still':
+        # The finished board is just the full grid over the base layer, so
+        # packing and the fall simulation are skipped entirely
+        for theme, output_path in outputs.items():
+            theme_colors = THEMES.get(theme, THEMES['light'])
+            print(f"Generating still image for {username} - Theme: {theme}")
+            board = render_base_layer(image_width, image_height, cell_size, username, year_range, theme_colors, month_labels)
+            draw_grid(board, levels, height, cell_size, theme, theme_colors)
+            write_still(output_path, board)
+        return
 
     # Reset grid for animation (background stays)
     # Background (val 0) is placed immediately, non-zero pieces fall
-    animated_grid = [[0] * height for _ in range(width)]
-    assigned = [[False]*height for _ in range(width)]
-    
-    # Fill level 0 in animated_grid and mark assigned
-    for wx in range(width):
-        for dy in range(height):
-            if (wx, dy) not in coord_to_val or coord_to_val[(wx, dy)] == 0:
-                animated_grid[wx][dy] = grid[wx][dy]
-                assigned[wx][dy] = True
-
-    final_pieces = []
-    for x in range(width):
-        # We process from bottom-up (Saturday to Sunday) to prioritize pieces at the bottom
-        for y in range(height-1, -1, -1):
-            if assigned[x][y]: continue
-            
-            for shape in fixed_shapes:
-                valid = True
-                for dx, dy in shape:
-                    nx, ny = x+dx, y+dy
-                    if nx < 0 or nx >= width or ny < 0 or ny >= height or assigned[nx][ny]:
-                        valid = False
-                        break
-                
-                if valid:
-                    shape_cells = []
-                    for dx, dy in shape:
-                        nx, ny = x+dx, y+dy
-                        assigned[nx][ny] = True
-                        cell_val = coord_to_val.get((nx, ny), 1)
-                        shape_cells.append((nx, ny, cell_val))
-                    
-                    final_pieces.append({
-                        "cells": shape_cells,
-                        "min_y": min(c[1] for c in shape_cells),
-                        "max_y": max(c[1] for c in shape_cells),
-                        "min_x": min(c[0] for c in shape_cells),
-                        "start_frame": max(0, (x - first_week_with_data)) * 4 # Optimized cascade
-                    })
-                    break
+    settled = bytearray(0 if fall else level for level, fall in zip(levels, falls))
+
+    final_pieces = pack_pieces(levels, falls, width, height, first_week_with_data)
 
     max_frames = width * 10 # More than enough
-    
-    # Store current falling y offsets
-    for p in final_pieces:
-        p["curr_y_offset"] = -(p["max_y"] + 1) # Start completely above the board
 
     print(f"  Animating {len(final_pieces)} group pieces...")
-    for frame in range(max_frames):
-        # --- 1. UPDATE STATE FIRST ---
-        moved_any = False
-        for p in final_pieces:
-            if frame >= p["start_frame"]:
-                if p["curr_y_offset"] < 0:
-                    p["curr_y_offset"] += 1
-                    moved_any = True
-                elif p["curr_y_offset"] == 0 and not p.get("landed"):
-                    # Just landed, add to animated grid
-                    for cx, cy, cv in p["cells"]:
-                        animated_grid[cx][cy] = cv
-                    p["landed"] = True
-                    moved_any = True
-        
-        # --- 2. DRAW AFTER STATE UPDATE ---
-        img = Image.new('RGB', (image_width, image_height), background_color)
-        draw = ImageDraw.Draw(img)
-        draw_legend(draw, cell_size, image_width, image_height, username, year_range, theme_colors, month_labels)
-        draw_grid(draw, animated_grid, cell_size, colors, theme_colors)
-        
-        # Draw falling pieces (still in the air)
-        for p in final_pieces:
-            if frame >= p["start_frame"] and p["curr_y_offset"] < 0:
-                for cx, cy, cv in p["cells"]:
-                    x0 = cx * cell_size + legend_width + 2
-                    y0 = (cy + p["curr_y_offset"]) * cell_size + 40 + 2
-                    # Define clip box to only show pieces within the grid vertically
-                    x1, y1 = x0 + cell_size - 4, y0 + cell_size - 4
-                    if y1 > 40: # Only draw if part of the cell is below the header
-                        draw.rounded_rectangle([x0, max(40, y0), x1, y1], radius=8, fill=colors[cv], outline=(255, 255, 255, 50))
-                        
-        # --- 3. APPEND FRAME ---
-        frames.append(img)
-
-        # End early if all pieces have landed
-        if len(final_pieces) > 0 and all(p.get("landed") for p in final_pieces):
-            # Add a 10-second static pause of the COMPLETE final image
-            for _ in range(100):
-                frames.append(img.copy())
-            break
-
-
-    # Save as animated GIF
-    if len(frames) == 0:
+    if fmt == 'svg' or (workers and workers > 1):
+        # SVG output and render workers derive each frame's state themselves;
+        # only the schedule is needed here
+        scheduled, durations = frame_schedule(final_pieces, max_frames)
+    else:
+        steps, durations = simulate_fall(final_pieces, max_frames)
+    if len(durations) == 0:
         raise Exception("No frames generated. Check contribution data.")
-        
-    # Ensure output directory exists before saving
-    import os
-    output_dir = os.path.dirname(output_path)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-        
-    frames[0].save(output_path, save_all=True, append_images=frames[1:], optimize=True, duration=100, loop=0)
+
+    for theme, output_path in outputs.items():
+        theme_colors = THEMES.get(theme, THEMES['light'])
+        print(f"Generating {'every format' if fmt == 'compare' else fmt.upper()} for {username} - Theme: {theme}")
+        if fmt == 'svg':
+            write_svg(output_path, final_pieces, settled, height, (image_width, image_height), cell_size, legend_width, month_labels, theme_colors, sum(durations))
+            continue
+
+        # Static background + legend, rendered once and copied into every frame
+        base_layer = render_base_layer(image_width, image_height, cell_size, username, year_range, theme_colors, month_labels)
+        if raster == 'numpy':
+            board_array = np.array(base_layer)
+            draw_grid_numpy(board_array, settled, height, cell_size, theme, theme_colors)
+            board = frame_from_array(board_array, base_layer.getpalette())
+        else:
+            board = base_layer.copy()
+            draw_grid(board, settled, height, cell_size, theme, theme_colors)
+        if workers and workers > 1:
+            frames = render_frames_parallel(final_pieces, scheduled, board, cell_size, legend_width, theme, workers, raster)
+        elif raster == 'numpy':
+            frames = render_frames_numpy(final_pieces, steps, board_array, board.getpalette(), cell_size, legend_width, theme, theme_colors)
+        else:
+            frames = render_frames(final_pieces, steps, board, cell_size, legend_width, theme, theme_colors)
+
+        if fmt == 'compare':
+            print_report(compare_backends(frames, durations, os.path.splitext(output_path)[0]))
+            continue
+        # `frames` is lazy: each frame is handed to an encoder process as soon
+        # as it is rendered, so rendering and encoding overlap. Only the
+        # changed region of each frame is stored (the writer also creates the
+        # output directory)
+        write_animation(output_path, frames, durations, loop=0, backend=fmt, pipeline=True)
+
+def rolling_window(contributions_all: List[Tuple[str, int]]) -> List[Tuple[Optional[str], int]]:
+    # Combine, deduplicate by date, and sort
+    all_map: Dict[str, int] = {}
+    for d, c in contributions_all:
+        if d:
+            all_map[d] = c  # later entries (current year) overwrite dupes
+    
+    # Build a day-by-day list from exactly 1 year ago to today
+    today = datetime.now()
+    # GitHub graph ends on the current Saturday (or today if Saturday)
+    # and starts 52 weeks before the prior Sunday
+    # Custom window: Sunday 52 weeks ago to the coming Saturday
+    days_to_sat = (5 - today.weekday()) % 7
+    end_date = today + timedelta(days=days_to_sat)
+    start_date = end_date - timedelta(days=52 * 7 + 6) # Sunday 53 weeks ago (total 372 days)
+    # Actually let's just make it exactly 53 weeks = 371 days
+    start_date = end_date - timedelta(days=370) # Sat - 370 = Sun
+    
+    today = datetime.now().date()
+    print(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} ({len(all_map)} total days in map)")
+    
+    rolling_contributions: List[Tuple[Optional[str], int]] = []
+    d = start_date
+    while d <= end_date:
+        ds = d.strftime('%Y-%m-%d')
+        count = all_map.get(ds, 0)
+        if d.date() <= today:
+            rolling_contributions.append((ds, count))
+        else:
+            rolling_contributions.append((None, 0))
+        d += timedelta(days=1)
+    
+    print(f"Total days: {len(rolling_contributions)}")
+    print("Last 7 days:")
+    for ds, c in rolling_contributions[-7:]:
+        print(f"  {ds}: {c}")
+    return rolling_contributions
+
+def fetch_contributions(username: str, cache_dir: Optional[str] = CACHE_DIR, offline: bool = False, session: Optional[requests.Session] = None) -> List[Tuple[Optional[str], int]]:
+    # Fetch current and previous year to get a full rolling window
+    current_year = datetime.now().year
+    contributions_current: List[Tuple[str, int]] = get_github_contributions(username, current_year, cache_dir, offline, session)
+    contributions_prev: List[Tuple[str, int]] = get_github_contributions(username, current_year - 1, cache_dir, offline, session)
+    return rolling_window(contributions_prev + contributions_current)
+
+def theme_outputs(output_path: str, themes: List[str]) -> Dict[str, str]:
+    # The first theme is written to output_path as given; the others get the
+    # theme name as a suffix, e.g. grid.gif -> grid-dark.gif
+    root, ext = os.path.splitext(output_path)
+    return {theme: output_path if i == 0 else f"{root}-{theme}{ext}" for i, theme in enumerate(themes)}
+
+def user_output(output_path: str, username: str) -> str:
+    # Batch outputs: fill a {username} placeholder, or prefix the file name
+    if '{username}' in output_path:
+        return output_path.replace('{username}', username)
+    directory, name = os.path.split(output_path)
+    return os.path.join(directory, f"{username}-{name}")
+
+def read_usernames(path: str) -> List[str]:
+    # One username per line; blank lines and # comments are ignored
+    with open(path) as f:
+        names = [line.split('#', 1)[0].strip() for line in f]
+    return list(dict.fromkeys(name for name in names if name))
+
+def run_batch(usernames: List[str], output_path: str, themes: List[str], cache_dir: Optional[str], offline: bool, jobs: Optional[int], fmt: str = 'gif') -> int:
+    # Fetches every user concurrently over one pooled session and renders each
+    # user's GIFs in a process pool as soon as their data arrives. A failing
+    # user is reported in the summary without stopping the others.
+    current_year = datetime.now().year
+    year_range = f"{current_year - 1} - {current_year}"
+    years = (current_year - 1, current_year)
+    fetch_workers = min(8, len(usernames) * len(years))
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=fetch_workers)
+    session.mount('https://', adapter)
+
+    started = time.time()
+    results: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, ProcessPoolExecutor(max_workers=jobs) as render_pool:
+        # Each year is its own fetch, so a user's two requests run side by side
+        fetches = {fetch_pool.submit(get_github_contributions, username, year, cache_dir, offline, session): (username, year) for username in usernames for year in years}
+        fetched: Dict[str, Dict[int, List[Tuple[str, int]]]] = {username: {} for username in usernames}
+        renders = {}
+        for future in as_completed(fetches):
+            username, year = fetches[future]
+            if username in results:
+                continue
+            try:
+                fetched[username][year] = future.result()
+            except Exception as e:
+                results[username] = f"FAILED  fetch: {e}"
+                continue
+            if len(fetched[username]) < len(years):
+                continue
+            contributions = rolling_window([day for year in years for day in fetched[username][year]])
+            outputs = theme_outputs(user_output(output_path, username), themes)
+            renders[render_pool.submit(create_tetris_gifs, username, current_year, contributions, outputs, year_range, None, 'pil', fmt)] = (username, outputs)
+
+        for future in as_completed(renders):
+            username, outputs = renders[future]
+            try:
+                future.result()
+                results[username] = f"ok      {', '.join(outputs.values())}"
+            except Exception as e:
+                results[username] = f"FAILED  render: {e}"
+    session.close()
+
+    failed = sum(1 for status in results.values() if status.startswith('FAILED'))
+    print(f"\nBatch summary ({len(usernames) - failed}/{len(usernames)} succeeded in {time.time() - started:.1f}s):")
+    width = max(len(username) for username in usernames)
+    for username in usernames:
+        print(f"  {username:<{width}}  {results[username]}")
+    return failed
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Generate a GitHub contributions Tetris GIF.')
-    parser.add_argument('-u', '--username', type=str, required=True, help='GitHub username')
+    users = parser.add_mutually_exclusive_group(required=True)
+    users.add_argument('-u', '--username', type=str, help='GitHub username')
+    users.add_argument('--batch', type=str, metavar='FILE', help='Render every username listed in FILE (one per line)')
     parser.add_argument('-y', '--year', type=int, default=datetime.now().year, help='Year for contributions')
-    parser.add_argument('--theme', type=str, choices=['light', 'dark'], default='light', help='Theme argument (light/dark)')
-    parser.add_argument('--output', type=str, default='tetris_github.gif', help='Output file name')
+    parser.add_argument('--theme', type=str, nargs='+', choices=list(THEMES) + ['all'], default=['light'], help='One or more themes (light/dark), or "all"')
+    parser.add_argument('--output', type=str, default='tetris_github.gif', help='Output file name (additional themes get a -<theme> suffix; in batch mode {username} is substituted or prefixed)')
+    parser.add_argument('--cache-dir', type=str, default=CACHE_DIR, help='Directory for cached API responses')
+    parser.add_argument('--no-cache', action='store_true', help='Always download, without reading or writing the cache')
+    parser.add_argument('--offline', action='store_true', help='Render from the cache only, without network access')
+    parser.add_argument('--fixture', type=str, help='Render from a saved API response (JSON) instead of fetching; implies --offline')
+    parser.add_argument('--jobs', type=int, default=None, help='Render processes in batch mode (default: CPU count)')
+    parser.add_argument('--workers', type=int, default=1, help='Processes used to rasterize frames for a single user (default: 1)')
+    parser.add_argument('--format', type=str, choices=list(FORMAT_EXTENSIONS), help='Output format (default: from the --output extension, else gif); a .gif --output gets the format\'s extension')
+    parser.add_argument('--compare', action='store_true', help='Encode the animation with every backend and report encode time and size')
+    parser.add_argument('--still', action='store_true', help='Only write the finished board as a still image (.png or .webp; a .gif --output becomes .png)')
+    parser.add_argument('--raster', type=str, choices=['pil', 'numpy'], default='pil', help='Frame rasterizer: PIL pastes or vectorized NumPy (requires numpy)')
     
     args = parser.parse_args()
+    themes = list(THEMES) if 'all' in args.theme else list(dict.fromkeys(args.theme))
+    cache_dir = None if args.no_cache else args.cache_dir
+    output_path = args.output
+    if args.still:
+        fmt = 'still'
+    elif args.compare:
+        fmt = 'compare'
+    elif args.format:
+        fmt = args.format
+    else:
+        extension = os.path.splitext(output_path)[1].lower()
+        fmt = 'svg' if extension == '.svg' else EXTENSIONS.get(extension, 'gif')
+    if fmt not in ('gif', 'compare') and output_path.endswith('.gif'):
+        output_path = output_path[:-len('.gif')] + ('.png' if fmt == 'still' else FORMAT_EXTENSIONS[fmt])
+
+    if args.batch:
+        try:
+            usernames = read_usernames(args.batch)
+        except OSError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if not usernames:
+            print(f"Error: no usernames in {args.batch}")
+            sys.exit(1)
+        sys.exit(1 if run_batch(usernames, output_path, themes, cache_dir, args.offline, args.jobs, fmt) else 0)
 
     try:
         current_year = datetime.now().year
-        # Fetch current and previous year to get a full rolling window
-        contributions_current: List[Tuple[str, int]] = get_github_contributions(args.username, current_year)
-        contributions_prev: List[Tuple[str, int]] = get_github_contributions(args.username, current_year - 1)
-        
-        # Combine, deduplicate by date, and sort
-        all_map: Dict[str, int] = {}
-        for d, c in contributions_prev + contributions_current:
-            if d:
-                all_map[d] = c  # later entries (current year) overwrite dupes
-        
-        # Build a day-by-day list from exactly 1 year ago to today
-        today = datetime.now()
-        # GitHub graph ends on the current Saturday (or today if Saturday)
-        # and starts 52 weeks before the prior Sunday
-        # Custom window: Sunday 52 weeks ago to the coming Saturday
-        days_to_sat = (5 - today.weekday()) % 7
-        end_date = today + timedelta(days=days_to_sat)
-        start_date = end_date - timedelta(days=52 * 7 + 6) # Sunday 53 weeks ago (total 372 days)
-        # Actually let's just make it exactly 53 weeks = 371 days
-        start_date = end_date - timedelta(days=370) # Sat - 370 = Sun
-        
-        today = datetime.now().date()
-        print(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} ({len(all_map)} total days in map)")
-        
-        rolling_contributions: List[Tuple[Optional[str], int]] = []
-        d = start_date
-        while d <= end_date:
-            ds = d.strftime('%Y-%m-%d')
-            count = all_map.get(ds, 0)
-            if d.date() <= today:
-                rolling_contributions.append((ds, count))
-            else:
-                rolling_contributions.append((None, 0))
-            d += timedelta(days=1)
-        
-        print(f"Total days: {len(rolling_contributions)}")
-        print("Last 7 days:")
-        for ds, c in rolling_contributions[-7:]:
-            print(f"  {ds}: {c}")
+        if args.fixture:
+            rolling_contributions = rolling_window(load_fixture(args.fixture))
+        else:
+            rolling_contributions = fetch_contributions(args.username, cache_dir, args.offline)
         
         year_range = f"{current_year - 1} - {current_year}"
-        create_tetris_gif(args.username, current_year, rolling_contributions, args.output, args.theme, year_range)
-        print("GIF created successfully!")
+        create_tetris_gifs(args.username, current_year, rolling_contributions, theme_outputs(output_path, themes), year_range, args.workers, args.raster, fmt)
+        if fmt != 'compare':
+            print("Still image created successfully!" if fmt == 'still' else f"{fmt.upper()} created successfully!")
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)